@@ -0,0 +1,11 @@
+"""
+HYBRID Address Derivation
+Native address encoding shared by the wallet modules
+"""
+
+import hashlib
+
+def wallet_address(public_key_bytes: bytes) -> str:
+    """HYBRID address for a raw public key: the first 39 hex digits of its SHA-256"""
+    # Only 20 digest bytes are needed for 39 hex digits
+    return f"hybrid1{hashlib.sha256(public_key_bytes).digest()[:20].hex()[:39]}"
@@ -3,12 +3,12 @@ HYBRID Blockchain Wallet System
 Native wallet management for the HYBRID blockchain
 """
 
-import hashlib
 import secrets
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.asymmetric import ed25519
+from blockchain.addresses import wallet_address
 
 @dataclass
 class HybridWallet:
@@ -33,12 +33,13 @@ class HybridWalletManager:
         public_key = private_key.public_key()
 
         # Create HYBRID address (bech32 format)
-        address = f"hybrid1{hashlib.sha256(public_key.public_bytes_raw()).hexdigest()[:39]}"
+        public_key_bytes = public_key.public_bytes_raw()
+        address = wallet_address(public_key_bytes)
 
         wallet = HybridWallet(
             address=address,
             private_key=private_key.private_bytes_raw().hex(),
-            public_key=public_key.public_bytes_raw().hex(),
+            public_key=public_key_bytes.hex(),
             balance=100_000_000_000,  # 100B HYBRID tokens
             mnemonic="hybrid founder genesis wallet secure blockchain network tokens"
         )
@@ -51,12 +52,13 @@ class HybridWalletManager:
         private_key = ed25519.Ed25519PrivateKey.generate()
         public_key = private_key.public_key()
 
-        address = f"hybrid1{hashlib.sha256(public_key.public_bytes_raw()).hexdigest()[:39]}"
+        public_key_bytes = public_key.public_bytes_raw()
+        address = wallet_address(public_key_bytes)
 
         wallet = HybridWallet(
             address=address,
             private_key=private_key.private_bytes_raw().hex(),
-            public_key=public_key.public_bytes_raw().hex(),
+            public_key=public_key_bytes.hex(),
             balance=0.0
         )
 
@@ -3,17 +3,31 @@ SpiralScript Trust Currency Engine for HYBRID Blockchain
 Advanced trust computation and currency management system with QASF integration
 """
 
-import asyncio
-import numpy as np
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import json
 import hashlib
 from datetime import datetime, timedelta
+from decimal import Decimal, Context
 import math
 import time
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Zero-point accounting spans 1e50..1e100 J/s, far past float64's exact range
+ZERO_POINT_CONTEXT = Context(prec=50)
+ZERO_POINT_CAP = Decimal('1e100')
+
+def _encode(obj: Any) -> bytes:
+    """Serialize a QCHAIN payload to JSON bytes, via orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, default=str, separators=(',', ':')).encode()
+
 class TrustMetric(Enum):
     RELIABILITY = "reliability"
     COMPETENCE = "competence"
@@ -272,7 +286,7 @@ class AdvancedSpiralScriptEngine:
             'phi_coherence': 1.618,
             'gate_status': 'GATE_740',
             'dimensional_alignment': ['3D-Earth'],
-            'zero_point_energy': 0.0,
+            'zero_point_energy': Decimal(0),
             'millennium_solved': []
         }
 
@@ -440,14 +454,17 @@ class AdvancedSpiralScriptEngine:
 
     def _zero_point_harness(self, target_energy: float) -> Dict[str, Any]:
         """Harness zero-point energy for system power"""
-        energy_extracted = min(target_energy, 1e100)  # Joules/second cap
-        self.spiral_context['zero_point_energy'] += energy_extracted
+        ctx = ZERO_POINT_CONTEXT
+        # Accumulate exactly in Decimal; only cast to float when emitting
+        energy_extracted = min(ctx.create_decimal(target_energy), ZERO_POINT_CAP)  # Joules/second cap
+        total = ctx.add(self.spiral_context['zero_point_energy'], energy_extracted)
+        self.spiral_context['zero_point_energy'] = total
 
         return {
-            'energy_extracted': energy_extracted,
-            'total_zero_point_energy': self.spiral_context['zero_point_energy'],
-            'system_performance_boost': min(energy_extracted / 1e20, 100),
-            'truth_tokens_generated': int(energy_extracted / 1e95)
+            'energy_extracted': float(energy_extracted),
+            'total_zero_point_energy': float(total),
+            'system_performance_boost': float(min(ctx.divide(energy_extracted, Decimal('1e20')), Decimal(100))),
+            'truth_tokens_generated': int(ctx.divide_int(energy_extracted, Decimal('1e95')))
         }
 
     def _dimension_bridge(self, source_dim: str, target_dim: str) -> Dict[str, Any]:
@@ -509,12 +526,13 @@ class AdvancedSpiralScriptEngine:
 
     async def _log_qchain_transaction(self, transaction_data: Dict[str, Any]):
         """Log transaction to QCHAIN for full transparency"""
+        payload = _encode(transaction_data)
         transaction = {
-            'tx_id': f"0x{hashlib.sha256(str(transaction_data).encode()).hexdigest()[:16]}",
+            'tx_id': f"0x{hashlib.sha256(payload).hexdigest()[:16]}",
             'timestamp': datetime.now().isoformat(),
             'phi_coherence': self.spiral_context.get('phi_coherence', 1.618),
             'gate_frequency': self.spiral_context.get('frequency', 740.0),
-            'data': transaction_data
+            'data': payload
         }
         # In a real implementation, this would log to the blockchain
         print(f"QCHAIN LOG: {transaction['tx_id']} - {transaction_data.get('type', 'unknown')}")
@@ -711,7 +729,7 @@ class EnhancedTrustCurrencyManager:
         self.currency_balances[address][target_currency] += seven_fold_output
 
         # Log to QCHAIN
-        await self._log_qchain_transaction({
+        await self.spiral_engine._log_qchain_transaction({
             'type': 'trust_pool_conversion',
             'address': address,
             'conversion_data': conversion_result,
@@ -736,18 +754,35 @@ class EnhancedTrustCurrencyManager:
             'timestamp': datetime.now().isoformat()
         }
 
-        await self._log_qchain_transaction({
+        await self.spiral_engine._log_qchain_transaction({
             'type': 'currency_mint',
             'mint_data': mint_result
         })
 
         return mint_result
 
+@dataclass(frozen=True)
+class PlatformFees:
+    """Per-platform fee and tax withholding rates"""
+    fee: float
+    tax: float
+
+PLATFORM_FEES = {
+    'Cash App': PlatformFees(fee=0.015, tax=0.20),  # 1.5% fee, 20% tax
+    'PayPal': PlatformFees(fee=0.025, tax=0.22),    # 2.5% fee, 22% tax
+    'Stripe': PlatformFees(fee=0.029, tax=0.21),    # 2.9% fee, 21% tax
+}
+
 class PublicFiatGate:
     """Public-Fiat Gate integration with Cash App, PayPal, Stripe"""
 
     def __init__(self):
-        self.supported_platforms = ['Cash App', 'PayPal', 'Stripe']
+        self._handlers = {
+            'Cash App': self._process_cash_app,
+            'PayPal': self._process_paypal,
+            'Stripe': self._process_stripe
+        }
+        self.supported_platforms = list(self._handlers)
         self.tax_compliance = True
 
     async def process_fiat_conversion(self, 
@@ -757,7 +792,8 @@ class PublicFiatGate:
                                     target_currency: str = 'Trust Units') -> Dict[str, Any]:
         """Process fiat conversion through public platforms"""
 
-        if platform not in self.supported_platforms:
+        handler = self._handlers.get(platform)
+        if not handler:
             return {'error': f'Unsupported platform: {platform}', 'success': False}
 
         conversion = {
@@ -774,44 +810,41 @@ class PublicFiatGate:
         }
 
         # Platform-specific processing
-        if platform == 'Cash App':
-            conversion.update(await self._process_cash_app(crypto_type, crypto_amount))
-        elif platform == 'PayPal':
-            conversion.update(await self._process_paypal(crypto_type, crypto_amount))
-        elif platform == 'Stripe':
-            conversion.update(await self._process_stripe(crypto_type, crypto_amount))
+        conversion.update(await handler(crypto_type, crypto_amount))
 
         return conversion
 
-    async def _process_cash_app(self, crypto_type: str, amount: float) -> Dict[str, Any]:
-        """Process through Cash App"""
+    @staticmethod
+    def _rate_for(crypto_type: str) -> float:
+        """Conversion rate shared by all public platforms"""
+        return 850.0 if crypto_type == 'SOL' else 1200000.0
+
+    def _platform_quote(self, platform: str, crypto_type: str, amount: float) -> Dict[str, Any]:
+        """Common rate/fee/tax template for a platform"""
+        fees = PLATFORM_FEES[platform]
         return {
-            'conversion_rate': 850.0 if crypto_type == 'SOL' else 1200000.0,
-            'transaction_fee': amount * 0.015,  # 1.5% fee
-            'tax_withholding': amount * 0.20,   # 20% tax
-            'bitcoin_handling': True,
-            'instant_settlement': True
+            'conversion_rate': self._rate_for(crypto_type),
+            'transaction_fee': amount * fees.fee,
+            'tax_withholding': amount * fees.tax
         }
 
+    async def _process_cash_app(self, crypto_type: str, amount: float) -> Dict[str, Any]:
+        """Process through Cash App"""
+        quote = self._platform_quote('Cash App', crypto_type, amount)
+        quote.update(bitcoin_handling=True, instant_settlement=True)
+        return quote
+
     async def _process_paypal(self, crypto_type: str, amount: float) -> Dict[str, Any]:
         """Process through PayPal"""
-        return {
-            'conversion_rate': 850.0 if crypto_type == 'SOL' else 1200000.0,
-            'transaction_fee': amount * 0.025,  # 2.5% fee
-            'tax_withholding': amount * 0.22,   # 22% tax
-            'global_reach': True,
-            'merchant_tools': True
-        }
+        quote = self._platform_quote('PayPal', crypto_type, amount)
+        quote.update(global_reach=True, merchant_tools=True)
+        return quote
 
     async def _process_stripe(self, crypto_type: str, amount: float) -> Dict[str, Any]:
         """Process through Stripe"""
-        return {
-            'conversion_rate': 850.0 if crypto_type == 'SOL' else 1200000.0,
-            'transaction_fee': amount * 0.029,  # 2.9% fee
-            'tax_withholding': amount * 0.21,   # 21% tax
-            'developer_friendly': True,
-            'api_integration': True
-        }
+        quote = self._platform_quote('Stripe', crypto_type, amount)
+        quote.update(developer_friendly=True, api_integration=True)
+        return quote
 
 # Global enhanced trust currency manager
 trust_currency_manager = TrustCurrencyManager()
@@ -9,12 +9,19 @@ import numpy as np
 import hashlib
 import json
 import base64
-from typing import Dict, List, Optional, Any, Tuple
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple, NamedTuple, Union, Iterator
 from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime
 import math
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class GlyphType(Enum):
     HEALING = "healing_glyph"
     HARMONY = "harmony_glyph"
@@ -23,58 +30,256 @@ class GlyphType(Enum):
     INTENT = "intent_glyph"
     DIMENSIONAL = "dimensional_glyph"
 
+_GLYPH_TYPES: Tuple[GlyphType, ...] = tuple(GlyphType)
+_GLYPH_TYPE_VALUES: Tuple[str, ...] = tuple(glyph_type.value for glyph_type in _GLYPH_TYPES)
+_N_GLYPH_TYPES = len(_GLYPH_TYPES)
+
+_EXECUTABLE_CODE_TEMPLATE = """
+// Executable Voynich Glyph Code
+// Intent: {intent}
+// Type: {glyph_type}
+// Frequency: {frequency} Hz
+
+async function executeGlyph(context) {{
+    const resonance = await harmonicResonance({frequency});
+    const coherence = calculatePhiCoherence(resonance);
+    
+    switch('{glyph_type}') {{
+        case 'healing_glyph':
+            return await processHealing(context, coherence);
+        case 'harmony_glyph':
+            return await processHarmony(context, coherence);
+        case 'truth_glyph':
+            return await processTruth(context, coherence);
+        case 'spiral_glyph':
+            return await processSpiral(context, coherence);
+        case 'intent_glyph':
+            return await processIntent(context, coherence);
+        case 'dimensional_glyph':
+            return await processDimensional(context, coherence);
+        default:
+            return await processGeneric(context, coherence);
+    }}
+}}
+
+function calculatePhiCoherence(resonance) {{
+    return 1.618 * (resonance / 740.0);
+}}
+"""
+
+# Glyph type is baked in per template; only intent and frequency vary per glyph
+_CODE_TEMPLATES: Dict[GlyphType, str] = {
+    glyph_type: _EXECUTABLE_CODE_TEMPLATE.replace('{glyph_type}', glyph_type.value)
+    for glyph_type in _GLYPH_TYPES
+}
+
+# hashlib only releases the GIL for inputs of at least 2048 bytes, so shorter
+# intents are hashed serially where threads would just add overhead
+_HASH_GIL_RELEASE_BYTES = 2048
+_HASH_WORKERS = os.cpu_count() or 1
+_hash_pool: Optional[ThreadPoolExecutor] = None
+
+_GLYPH_TABLE_INITIAL_CAPACITY = 1024
+
 class VoynichFrequency(Enum):
     BASE = 702.5
     HARMONIC = 740.0
     RESONANT = 1099.7
     INFINITE = float('inf')
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HolographicGlyph:
     """Represents a holographic Voynich glyph"""
     id: str
     glyph_type: GlyphType
     frequency: float
     harmonic_signature: str
-    intent_encoding: str
+    intent: str
+    dimensional_coords: Tuple[float, float, float]
+    radius: float
+    truth_tokens: int
+    phi_coherence: float
+    
+    @property
+    def executable_code(self) -> str:
+        """Executable glyph code, rendered from the per-type template on access"""
+        return _CODE_TEMPLATES[self.glyph_type].format(intent=self.intent, frequency=self.frequency)
+    
+    @property
+    def intent_encoding(self) -> str:
+        """Base64 wire encoding of the intent, built on demand"""
+        return base64.b64encode(self.intent.encode()).decode()
+
+class _GlyphView(NamedTuple):
+    """Read-only view of a glyph table row, accepted by the protocol executors"""
+    glyph_type: GlyphType
+    frequency: float
+    intent: str
     dimensional_coords: Tuple[float, float, float]
+    radius: float
     truth_tokens: int
-    executable_code: str
     phi_coherence: float
+
+class _RenderColumns(NamedTuple):
+    """Per-glyph columns of one 32K render, as computed for that render"""
+    glyph_ids: List[str]
+    type_codes: np.ndarray
+    frequencies: np.ndarray
+    coords: np.ndarray
+    truth_tokens: np.ndarray
+    phi_coherence: np.ndarray
+
+def _encode(obj: Any) -> bytes:
+    """Serialize a render payload to JSON bytes, via orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, default=lambda o: o.tolist() if isinstance(o, np.ndarray) else str(o)).encode()
+
+def _hash_chunk(intents: List[bytes]) -> bytes:
+    """Concatenated SHA-256 digests for a shard of encoded intents"""
+    return b"".join(hashlib.sha256(intent).digest() for intent in intents)
+
+def _hash_intents(intents: List[bytes]) -> np.ndarray:
+    """SHA-256 digests for a batch of encoded intents as an (N, 32) uint8 array"""
+    global _hash_pool
+    
+    if _HASH_WORKERS > 1 and len(intents) >= _HASH_WORKERS and min(map(len, intents)) >= _HASH_GIL_RELEASE_BYTES:
+        if _hash_pool is None:
+            _hash_pool = ThreadPoolExecutor(max_workers=_HASH_WORKERS, thread_name_prefix="glyph-hash")
+        shard_size = -(-len(intents) // _HASH_WORKERS)
+        shards = [intents[i:i + shard_size] for i in range(0, len(intents), shard_size)]
+        digests = b"".join(_hash_pool.map(_hash_chunk, shards))
+    else:
+        digests = _hash_chunk(intents)
+    
+    return np.frombuffer(digests, dtype=np.uint8).reshape(-1, 32)
+
+def _compute_glyph_fields(digests: np.ndarray,
+                          frequencies: np.ndarray,
+                          intent_lengths: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Derive (coords, phi_coherence, truth_tokens) for a batch of glyphs in one pass"""
+    coords = np.subtract(digests[:, :3], 128, dtype=np.float64)
+    coords /= 128.0
+    coords *= 10  # Range: -10 to 10
+    
+    phi_coherence = np.divide(frequencies, 740.0)
+    phi_coherence *= 1.618
+    
+    truth_tokens = np.multiply(intent_lengths, frequencies)
+    truth_tokens /= 10
+    
+    return coords, phi_coherence, truth_tokens.astype(np.int64)
+
+class GlyphTable:
+    """Columnar (structure-of-arrays) storage for rendered holographic glyphs"""
+    
+    def __init__(self):
+        self.ids: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.intents: List[str] = []
+        self.glyph_types = np.empty(_GLYPH_TABLE_INITIAL_CAPACITY, dtype=np.int8)
+        self.frequencies = np.empty(_GLYPH_TABLE_INITIAL_CAPACITY, dtype=np.float64)
+        self.coords = np.empty((_GLYPH_TABLE_INITIAL_CAPACITY, 3), dtype=np.float64)
+        self.radii = np.empty(_GLYPH_TABLE_INITIAL_CAPACITY, dtype=np.float64)
+        self.truth_tokens = np.empty(_GLYPH_TABLE_INITIAL_CAPACITY, dtype=np.int64)
+        self.phi_coherence = np.empty(_GLYPH_TABLE_INITIAL_CAPACITY, dtype=np.float64)
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def __contains__(self, glyph_id: str) -> bool:
+        return glyph_id in self.index
+    
+    def append_batch(self,
+                     ids: List[str],
+                     glyph_types: np.ndarray,
+                     frequencies: np.ndarray,
+                     coords: np.ndarray,
+                     truth_tokens: np.ndarray,
+                     phi_coherence: np.ndarray,
+                     intents: List[str]) -> np.ndarray:
+        """Upsert a batch of glyph rows, returning the table row of every batch entry
+        
+        Ids already in the table are overwritten in place; only new ids get new rows.
+        """
+        index = self.index
+        start = len(self.ids)
+        rows = np.empty(len(ids), dtype=np.int64)
+        for position, (glyph_id, intent) in enumerate(zip(ids, intents)):
+            row = index.get(glyph_id)
+            if row is None:
+                row = index[glyph_id] = len(self.ids)
+                self.ids.append(glyph_id)
+                self.intents.append(intent)
+            else:
+                self.intents[row] = intent
+            rows[position] = row
+        
+        end = len(self.ids)
+        capacity = self.glyph_types.shape[0]
+        if end > capacity:
+            while capacity < end:
+                capacity *= 2
+            for name in ('glyph_types', 'frequencies', 'coords', 'radii', 'truth_tokens', 'phi_coherence'):
+                column = getattr(self, name)
+                grown = np.empty((capacity,) + column.shape[1:], dtype=column.dtype)
+                grown[:start] = column[:start]
+                setattr(self, name, grown)
+        
+        # The last entry wins when an id repeats within the batch
+        unique_rows, reversed_positions = np.unique(rows[::-1], return_index=True)
+        positions = len(ids) - 1 - reversed_positions
+        self.glyph_types[unique_rows] = glyph_types[positions]
+        self.frequencies[unique_rows] = frequencies[positions]
+        self.coords[unique_rows] = coords[positions]
+        self.radii[unique_rows] = np.linalg.norm(coords[positions], axis=1)
+        self.truth_tokens[unique_rows] = truth_tokens[positions]
+        self.phi_coherence[unique_rows] = phi_coherence[positions]
+        
+        return rows
+    
+    def intent(self, row: int) -> str:
+        """Return the intent string stored for a row"""
+        return self.intents[row]
     
 class SpiralVoynichInterface:
     """Advanced Voynich Interface with Holographic Rendering"""
     
     def __init__(self):
         self.holographic_glyphs: Dict[str, HolographicGlyph] = {}
+        # Rendered glyphs, materialized into HolographicGlyph objects on demand
+        self.glyph_table = GlyphTable()
         self.rendered_holograms: List[Dict] = []
         self.covenant_data: Dict[str, Any] = {}
         self.spiral_vision_engine = SpiralVisionEngine()
+        self._protocol_dispatch = {
+            GlyphType.HEALING: self._execute_healing_protocol,
+            GlyphType.HARMONY: self._execute_harmony_protocol,
+            GlyphType.TRUTH: self._execute_truth_protocol,
+            GlyphType.SPIRAL: self._execute_spiral_protocol,
+            GlyphType.INTENT: self._execute_intent_protocol,
+            GlyphType.DIMENSIONAL: self._execute_dimensional_protocol
+        }
+        self.glyph_batcher = GlyphExecutionBatcher(self)
         
-    async def generate_holographic_glyph(self, 
-                                       intent: str, 
-                                       glyph_type: GlyphType,
-                                       frequency: float = 740.0) -> HolographicGlyph:
+    def generate_holographic_glyph(self, 
+                                 intent: str, 
+                                 glyph_type: GlyphType,
+                                 frequency: float = 740.0) -> HolographicGlyph:
         """Generate a new holographic Voynich glyph"""
         
         # Generate unique glyph ID
-        glyph_id = f"VG_{hashlib.sha256(intent.encode()).hexdigest()[:8]}"
+        intent_hash = hashlib.sha256(intent.encode()).digest()
+        glyph_id = f"VG_{intent_hash[:4].hex()}"
         
         # Calculate dimensional coordinates based on intent
-        intent_hash = hashlib.sha256(intent.encode()).digest()
         x = (intent_hash[0] - 128) / 128.0 * 10  # Range: -10 to 10
         y = (intent_hash[1] - 128) / 128.0 * 10
         z = (intent_hash[2] - 128) / 128.0 * 10
         
         # Generate harmonic signature
         harmonic_data = f"{intent}:{frequency}:{glyph_type.value}"
-        harmonic_signature = hashlib.sha3_256(harmonic_data.encode()).hexdigest()[:16]
-        
-        # Encode intent into glyph structure
-        intent_encoded = base64.b64encode(intent.encode()).decode()
-        
-        # Generate executable code for the glyph
-        executable_code = self._generate_executable_code(intent, glyph_type, frequency)
+        harmonic_signature = hashlib.blake2b(harmonic_data.encode(), digest_size=8).hexdigest()
         
         # Calculate truth tokens based on intent complexity and frequency
         truth_tokens = int(len(intent) * frequency / 10)
@@ -87,10 +292,10 @@ class SpiralVoynichInterface:
             glyph_type=glyph_type,
             frequency=frequency,
             harmonic_signature=harmonic_signature,
-            intent_encoding=intent_encoded,
+            intent=intent,
             dimensional_coords=(x, y, z),
+            radius=math.hypot(x, y, z),
             truth_tokens=truth_tokens,
-            executable_code=executable_code,
             phi_coherence=phi_coherence
         )
         
@@ -98,71 +303,94 @@ class SpiralVoynichInterface:
         
         return glyph
     
-    async def render_32k_holograms(self, 
-                                 base_frequency: float = 740.0,
-                                 intent_theme: str = "Cosmic Truth") -> Dict[str, Any]:
-        """Render 32,000 holographic glyphs at 60 FPS"""
+    def _render_to_table(self, intent_theme: str) -> _RenderColumns:
+        """Render 32,000 glyphs into the glyph table, returning the columns computed for this render
         
-        render_result = {
-            'total_holograms': 32000,
-            'fps': 60,
-            'base_frequency': base_frequency,
-            'frequency_range': (702.5, 1099.7),
-            'rendered_glyphs': [],
-            'total_truth_tokens': 0,
-            'covenant_fragments': [],
-            'dimensional_map': {}
-        }
+        Glyph ids can collide, so the table keeps only the last glyph per id while
+        the returned columns keep every rendered glyph.
+        """
         
         # Generate frequency spectrum across 32K holograms
         freq_min, freq_max = 702.5, 1099.7
-        frequency_step = (freq_max - freq_min) / 32000
+        spectrum = np.linspace(freq_min, freq_max, 32000, endpoint=False)
         
         # Batch process glyphs for performance
         batch_size = 1000
         total_batches = 32000 // batch_size
         
+        rendered = _RenderColumns(
+            glyph_ids=[],
+            type_codes=np.empty(32000, dtype=np.int8),
+            frequencies=spectrum,
+            coords=np.empty((32000, 3), dtype=np.float64),
+            truth_tokens=np.empty(32000, dtype=np.int64),
+            phi_coherence=np.empty(32000, dtype=np.float64)
+        )
+        
         for batch_idx in range(total_batches):
-            batch_glyphs = []
+            batch_start = batch_idx * batch_size
+            glyph_indices = np.arange(batch_start, batch_start + batch_size)
             
-            for i in range(batch_size):
-                glyph_idx = batch_idx * batch_size + i
-                
-                # Generate unique intent for each glyph
-                intent = f"{intent_theme} Fragment {glyph_idx:05d}"
-                frequency = freq_min + (glyph_idx * frequency_step)
-                
-                # Vary glyph types
-                glyph_types = list(GlyphType)
-                glyph_type = glyph_types[glyph_idx % len(glyph_types)]
-                
-                # Generate glyph
-                glyph = await self.generate_holographic_glyph(intent, glyph_type, frequency)
-                
-                batch_glyphs.append({
-                    'id': glyph.id,
-                    'type': glyph.glyph_type.value,
-                    'frequency': glyph.frequency,
-                    'coords': glyph.dimensional_coords,
-                    'truth_tokens': glyph.truth_tokens,
-                    'phi_coherence': glyph.phi_coherence
-                })
-                
-                render_result['total_truth_tokens'] += glyph.truth_tokens
+            # Generate unique intent for each glyph and hash the whole batch at once
+            intents = [f"{intent_theme} Fragment {glyph_idx:05d}" for glyph_idx in glyph_indices.tolist()]
+            digests = _hash_intents([intent.encode() for intent in intents])
+            
+            # Derive all glyph fields for the batch with vectorized math
+            frequencies = spectrum[batch_start:batch_start + batch_size]
+            intent_lengths = np.fromiter((len(intent) for intent in intents), dtype=np.int64, count=batch_size)
+            coords, phi_coherence, truth_tokens = _compute_glyph_fields(digests, frequencies, intent_lengths)
+            id_hex = digests[:, :4].tobytes().hex()
+            glyph_ids = [f"VG_{id_hex[i:i + 8]}" for i in range(0, len(id_hex), 8)]
+            type_codes = glyph_indices % _N_GLYPH_TYPES
             
-            render_result['rendered_glyphs'].extend(batch_glyphs)
+            # Full HolographicGlyph objects are only built when a glyph is executed
+            self.glyph_table.append_batch(glyph_ids, type_codes, frequencies, coords,
+                                          truth_tokens, phi_coherence, intents)
+            
+            batch = slice(batch_start, batch_start + batch_size)
+            rendered.glyph_ids.extend(glyph_ids)
+            rendered.type_codes[batch] = type_codes
+            rendered.coords[batch] = coords
+            rendered.truth_tokens[batch] = truth_tokens
+            rendered.phi_coherence[batch] = phi_coherence
             
             # Simulate rendering progress
             if batch_idx % 10 == 0:
                 progress = (batch_idx / total_batches) * 100
                 print(f"Rendering progress: {progress:.1f}%")
         
+        return rendered
+    
+    async def render_32k_holograms(self, 
+                                 base_frequency: float = 740.0,
+                                 intent_theme: str = "Cosmic Truth") -> Dict[str, Any]:
+        """Render 32,000 holographic glyphs at 60 FPS"""
+        
+        rendered = self._render_to_table(intent_theme)
+        
+        # Per-glyph data stays columnar; use rendered_glyphs_iter() for per-glyph dicts
+        render_result = {
+            'total_holograms': 32000,
+            'fps': 60,
+            'base_frequency': base_frequency,
+            'frequency_range': (702.5, 1099.7),
+            'glyph_ids': rendered.glyph_ids,
+            'type_codes': rendered.type_codes,
+            'frequencies': rendered.frequencies,
+            'coords': rendered.coords,
+            'truth_tokens': rendered.truth_tokens,
+            'phi_coherence': rendered.phi_coherence,
+            'total_truth_tokens': int(rendered.truth_tokens.sum()),
+            'covenant_fragments': [],
+            'dimensional_map': {}
+        }
+        
         # Generate Covenant of Healing and Harmony fragments
-        covenant_fragments = await self._extract_covenant_fragments(render_result['rendered_glyphs'])
+        covenant_fragments = self._extract_covenant_fragments(render_result['frequencies'])
         render_result['covenant_fragments'] = covenant_fragments
         
         # Create dimensional map
-        dimensional_map = self._create_dimensional_map(render_result['rendered_glyphs'])
+        dimensional_map = self._create_dimensional_map(render_result['glyph_ids'], render_result['coords'])
         render_result['dimensional_map'] = dimensional_map
         
         # Store render result
@@ -170,21 +398,69 @@ class SpiralVoynichInterface:
         
         return render_result
     
+    def rendered_glyphs_iter(self, render_result: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """Lazily yield per-glyph dicts for a render, defaulting to the most recent one"""
+        if render_result is None:
+            if not self.rendered_holograms:
+                return
+            render_result = self.rendered_holograms[-1]
+        
+        for glyph_id, type_code, frequency, xyz, tokens, phi in zip(
+                render_result['glyph_ids'], render_result['type_codes'].tolist(),
+                render_result['frequencies'].tolist(), render_result['coords'].tolist(),
+                render_result['truth_tokens'].tolist(), render_result['phi_coherence'].tolist()):
+            yield {
+                'id': glyph_id,
+                'type': _GLYPH_TYPE_VALUES[type_code],
+                'frequency': frequency,
+                'coords': tuple(xyz),
+                'truth_tokens': tokens,
+                'phi_coherence': phi
+            }
+    
+    async def render_32k_holograms_bytes(self,
+                                       base_frequency: float = 740.0,
+                                       intent_theme: str = "Cosmic Truth") -> bytes:
+        """Render 32,000 holographic glyphs straight to a columnar JSON payload"""
+        
+        rendered = self._render_to_table(intent_theme)
+        
+        return _encode({
+            'total_holograms': 32000,
+            'fps': 60,
+            'base_frequency': base_frequency,
+            'frequency_range': (702.5, 1099.7),
+            'glyph_types': _GLYPH_TYPE_VALUES,
+            'ids': rendered.glyph_ids,
+            'type_codes': rendered.type_codes,
+            'frequencies': rendered.frequencies,
+            'coords': rendered.coords,
+            'truth_tokens': rendered.truth_tokens,
+            'phi_coherence': rendered.phi_coherence,
+            'total_truth_tokens': int(rendered.truth_tokens.sum()),
+            'dimensional_map': self._create_dimensional_map(rendered.glyph_ids, rendered.coords)
+        })
+    
     async def execute_glyph_intent(self, glyph_id: str, execution_context: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the intent encoded in a holographic glyph"""
         
-        if glyph_id not in self.holographic_glyphs:
+        glyph = self._resolve_glyph(glyph_id)
+        if glyph is None:
             return {'error': 'Glyph not found', 'success': False}
         
-        glyph = self.holographic_glyphs[glyph_id]
-        
-        # Decode intent
-        decoded_intent = base64.b64decode(glyph.intent_encoding).decode()
+        return self._execute_glyph(glyph_id, glyph, execution_context)
+    
+    async def batch_execute(self, glyph_id: str, execution_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Execute a glyph intent, coalesced with other concurrent calls into one batch"""
+        return await self.glyph_batcher.submit(glyph_id, execution_context or {})
+    
+    def _execute_glyph(self, glyph_id: str, glyph: Union[HolographicGlyph, _GlyphView], execution_context: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the execution result for a glyph or glyph table view"""
         
         # Execute glyph code
         execution_result = {
             'glyph_id': glyph_id,
-            'intent': decoded_intent,
+            'intent': glyph.intent,
             'success': True,
             'truth_tokens_generated': glyph.truth_tokens,
             'harmonic_resonance': glyph.frequency,
@@ -194,21 +470,52 @@ class SpiralVoynichInterface:
         }
         
         # Simulate code execution based on glyph type
-        if glyph.glyph_type == GlyphType.HEALING:
-            execution_result['executable_output'] = await self._execute_healing_protocol(glyph, execution_context)
-        elif glyph.glyph_type == GlyphType.HARMONY:
-            execution_result['executable_output'] = await self._execute_harmony_protocol(glyph, execution_context)
-        elif glyph.glyph_type == GlyphType.TRUTH:
-            execution_result['executable_output'] = await self._execute_truth_protocol(glyph, execution_context)
-        elif glyph.glyph_type == GlyphType.SPIRAL:
-            execution_result['executable_output'] = await self._execute_spiral_protocol(glyph, execution_context)
-        elif glyph.glyph_type == GlyphType.INTENT:
-            execution_result['executable_output'] = await self._execute_intent_protocol(glyph, execution_context)
-        elif glyph.glyph_type == GlyphType.DIMENSIONAL:
-            execution_result['executable_output'] = await self._execute_dimensional_protocol(glyph, execution_context)
+        execution_result['executable_output'] = self._protocol_dispatch[glyph.glyph_type](glyph, execution_context)
         
         return execution_result
     
+    def _execute_glyph_batch(self,
+                             glyph_ids: List[str],
+                             contexts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Execute many glyphs at once, reading rendered glyphs straight from the glyph table"""
+        table = self.glyph_table
+        results: List[Optional[Dict[str, Any]]] = [None] * len(glyph_ids)
+        positions, rows = [], []
+        
+        for position, glyph_id in enumerate(glyph_ids):
+            glyph = self.holographic_glyphs.get(glyph_id)
+            row = table.index.get(glyph_id)
+            if glyph is not None:
+                results[position] = self._execute_glyph(glyph_id, glyph, contexts[position])
+            elif row is not None:
+                positions.append(position)
+                rows.append(row)
+            else:
+                results[position] = {'error': 'Glyph not found', 'success': False}
+        
+        if rows:
+            # Gather every column for the batch in one fancy-indexing pass
+            index = np.array(rows, dtype=np.int64)
+            for position, row, type_code, frequency, xyz, radius, tokens, phi in zip(
+                    positions, rows, table.glyph_types[index].tolist(), table.frequencies[index].tolist(),
+                    table.coords[index].tolist(), table.radii[index].tolist(),
+                    table.truth_tokens[index].tolist(), table.phi_coherence[index].tolist()):
+                view = _GlyphView(_GLYPH_TYPES[type_code], frequency, table.intent(row), tuple(xyz), radius, tokens, phi)
+                results[position] = self._execute_glyph(glyph_ids[position], view, contexts[position])
+        
+        return results
+    
+    
+    def _resolve_glyph(self, glyph_id: str) -> Optional[HolographicGlyph]:
+        """Look up a glyph, materializing it from the render table if needed"""
+        glyph = self.holographic_glyphs.get(glyph_id)
+        row = self.glyph_table.index.get(glyph_id)
+        if glyph is None and row is not None:
+            table = self.glyph_table
+            glyph_type = _GLYPH_TYPES[table.glyph_types[row]]
+            glyph = self.generate_holographic_glyph(table.intent(row), glyph_type, float(table.frequencies[row]))
+        return glyph
+    
     async def decode_voynich_manuscript(self) -> Dict[str, Any]:
         """Decode the complete Voynich Manuscript as Covenant of Healing and Harmony"""
         
@@ -239,10 +546,10 @@ class SpiralVoynichInterface:
             # Generate glyphs for this section
             for j in range(40):  # 40 glyphs per section
                 intent = f"{theme} - Protocol {j+1}"
-                glyph_type = list(GlyphType)[j % len(GlyphType)]
+                glyph_type = _GLYPH_TYPES[j % _N_GLYPH_TYPES]
                 frequency = 740.0 + (i * 10) + (j * 0.5)
                 
-                glyph = await self.generate_holographic_glyph(intent, glyph_type, frequency)
+                glyph = self.generate_holographic_glyph(intent, glyph_type, frequency)
                 section_glyphs.append(glyph)
             
             section = {
@@ -258,44 +565,7 @@ class SpiralVoynichInterface:
         
         return covenant_result
     
-    def _generate_executable_code(self, intent: str, glyph_type: GlyphType, frequency: float) -> str:
-        """Generate executable code for a glyph"""
-        
-        code_template = f"""
-// Executable Voynich Glyph Code
-// Intent: {intent}
-// Type: {glyph_type.value}
-// Frequency: {frequency} Hz
-
-async function executeGlyph(context) {{
-    const resonance = await harmonicResonance({frequency});
-    const coherence = calculatePhiCoherence(resonance);
-    
-    switch('{glyph_type.value}') {{
-        case 'healing_glyph':
-            return await processHealing(context, coherence);
-        case 'harmony_glyph':
-            return await processHarmony(context, coherence);
-        case 'truth_glyph':
-            return await processTruth(context, coherence);
-        case 'spiral_glyph':
-            return await processSpiral(context, coherence);
-        case 'intent_glyph':
-            return await processIntent(context, coherence);
-        case 'dimensional_glyph':
-            return await processDimensional(context, coherence);
-        default:
-            return await processGeneric(context, coherence);
-    }}
-}}
-
-function calculatePhiCoherence(resonance) {{
-    return 1.618 * (resonance / 740.0);
-}}
-"""
-        return code_template
-    
-    async def _execute_healing_protocol(self, glyph: HolographicGlyph, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _execute_healing_protocol(self, glyph: HolographicGlyph, context: Dict[str, Any]) -> Dict[str, Any]:
         """Execute healing protocol"""
         return {
             'protocol': 'healing',
@@ -304,16 +574,16 @@ function calculatePhiCoherence(resonance) {{
             'dimensional_healing': glyph.dimensional_coords
         }
     
-    async def _execute_harmony_protocol(self, glyph: HolographicGlyph, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _execute_harmony_protocol(self, glyph: HolographicGlyph, context: Dict[str, Any]) -> Dict[str, Any]:
         """Execute harmony protocol"""
         return {
             'protocol': 'harmony',
             'harmonic_frequency': glyph.frequency,
             'coherence_field': glyph.phi_coherence,
-            'harmony_radius': math.sqrt(sum(c**2 for c in glyph.dimensional_coords))
+            'harmony_radius': glyph.radius
         }
     
-    async def _execute_truth_protocol(self, glyph: HolographicGlyph, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _execute_truth_protocol(self, glyph: HolographicGlyph, context: Dict[str, Any]) -> Dict[str, Any]:
         """Execute truth protocol"""
         return {
             'protocol': 'truth',
@@ -322,7 +592,7 @@ function calculatePhiCoherence(resonance) {{
             'truth_coherence': glyph.phi_coherence
         }
     
-    async def _execute_spiral_protocol(self, glyph: HolographicGlyph, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _execute_spiral_protocol(self, glyph: HolographicGlyph, context: Dict[str, Any]) -> Dict[str, Any]:
         """Execute spiral protocol"""
         return {
             'protocol': 'spiral',
@@ -331,17 +601,16 @@ function calculatePhiCoherence(resonance) {{
             'spiral_coordinates': glyph.dimensional_coords
         }
     
-    async def _execute_intent_protocol(self, glyph: HolographicGlyph, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _execute_intent_protocol(self, glyph: HolographicGlyph, context: Dict[str, Any]) -> Dict[str, Any]:
         """Execute intent protocol"""
-        decoded_intent = base64.b64decode(glyph.intent_encoding).decode()
         return {
             'protocol': 'intent',
-            'intent_executed': decoded_intent,
+            'intent_executed': glyph.intent,
             'intent_power': glyph.truth_tokens,
             'intent_resonance': glyph.frequency
         }
     
-    async def _execute_dimensional_protocol(self, glyph: HolographicGlyph, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _execute_dimensional_protocol(self, glyph: HolographicGlyph, context: Dict[str, Any]) -> Dict[str, Any]:
         """Execute dimensional protocol"""
         return {
             'protocol': 'dimensional',
@@ -350,7 +619,7 @@ function calculatePhiCoherence(resonance) {{
             'dimensional_coherence': glyph.phi_coherence
         }
     
-    async def _extract_covenant_fragments(self, rendered_glyphs: List[Dict]) -> List[str]:
+    def _extract_covenant_fragments(self, frequencies: np.ndarray) -> List[str]:
         """Extract Covenant of Healing and Harmony fragments"""
         fragments = [
             "In the beginning, all was chaos, and chaos sought harmony.",
@@ -363,42 +632,91 @@ function calculatePhiCoherence(resonance) {{
             "The manuscript speaks to those who listen with their hearts."
         ]
         
-        # Generate additional fragments based on glyph data
-        for i in range(0, min(len(rendered_glyphs), 100), 10):
-            glyph_batch = rendered_glyphs[i:i+10]
-            avg_frequency = sum(g['frequency'] for g in glyph_batch) / len(glyph_batch)
-            fragment = f"At frequency {avg_frequency:.1f} Hz, the cosmic truth resonates with {len(glyph_batch)} harmonics."
-            fragments.append(fragment)
+        # Generate additional fragments from the mean frequency of each 10-glyph group
+        sample_size = min(len(frequencies), 100)
+        if sample_size:
+            starts = np.arange(0, sample_size, 10)
+            window = frequencies[:starts[-1] + 10]
+            group_sizes = np.diff(np.append(starts, len(window)))
+            avg_frequencies = np.add.reduceat(window, starts) / group_sizes
+            for avg_frequency, group_size in zip(avg_frequencies.tolist(), group_sizes.tolist()):
+                fragment = f"At frequency {avg_frequency:.1f} Hz, the cosmic truth resonates with {group_size} harmonics."
+                fragments.append(fragment)
         
         return fragments
     
-    def _create_dimensional_map(self, rendered_glyphs: List[Dict]) -> Dict[str, Any]:
+    def _create_dimensional_map(self, glyph_ids: List[str], coords: np.ndarray) -> Dict[str, Any]:
         """Create a dimensional map of holographic glyphs"""
         dimensional_map = {
-            'total_glyphs': len(rendered_glyphs),
+            'total_glyphs': len(glyph_ids),
             'dimensional_clusters': {},
             'frequency_distribution': {},
             'coherence_patterns': []
         }
         
-        # Group glyphs by dimensional regions
-        for glyph in rendered_glyphs:
-            x, y, z = glyph['coords']
-            
-            # Determine dimensional region
-            region_x = int(x // 2) * 2  # Group by 2-unit regions
-            region_y = int(y // 2) * 2
-            region_z = int(z // 2) * 2
-            
+        if not glyph_ids:
+            return dimensional_map
+        
+        # Group glyphs by 2-unit dimensional regions in one vectorized pass
+        regions = (np.floor_divide(coords, 2) * 2).astype(np.int32)
+        unique_regions, first_seen, cluster_ids, counts = np.unique(
+            regions, axis=0, return_index=True, return_inverse=True, return_counts=True)
+        cluster_ids = cluster_ids.reshape(-1)
+        
+        # Gather member ids per cluster, keeping clusters in first-seen order
+        members = np.array(glyph_ids, dtype=object)[np.argsort(cluster_ids, kind='stable')]
+        bounds = np.concatenate(([0], np.cumsum(counts)))
+        for cluster in np.argsort(first_seen).tolist():
+            region_x, region_y, region_z = unique_regions[cluster].tolist()
             region_key = f"({region_x},{region_y},{region_z})"
-            
-            if region_key not in dimensional_map['dimensional_clusters']:
-                dimensional_map['dimensional_clusters'][region_key] = []
-            
-            dimensional_map['dimensional_clusters'][region_key].append(glyph['id'])
+            dimensional_map['dimensional_clusters'][region_key] = members[bounds[cluster]:bounds[cluster + 1]].tolist()
         
         return dimensional_map
 
+class GlyphExecutionBatcher:
+    """Coalesces concurrent glyph executions into batches on the running event loop"""
+    
+    def __init__(self, interface: SpiralVoynichInterface, max_batch_size: int = 1024):
+        self.interface = interface
+        self.max_batch_size = max_batch_size
+        self._pending: List[Tuple[str, Dict[str, Any], asyncio.Future]] = []
+        self._flush_scheduled = False
+    
+    async def submit(self, glyph_id: str, execution_context: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue a glyph execution and wait for its batch to complete"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((glyph_id, execution_context, future))
+        
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif not self._flush_scheduled:
+            # Let every caller queued in this loop iteration join the batch
+            self._flush_scheduled = True
+            loop.call_soon(self._flush)
+        
+        return await future
+    
+    def _flush(self):
+        """Execute all pending requests as one batch and resolve their futures"""
+        self._flush_scheduled = False
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        
+        try:
+            results = self.interface._execute_glyph_batch([glyph_id for glyph_id, _, _ in batch],
+                                                          [context for _, context, _ in batch])
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (_, _, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
 class SpiralVisionEngine:
     """3D/WebXR rendering engine for holographic glyphs"""
     
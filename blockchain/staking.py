@@ -6,7 +6,10 @@ Token staking, delegation, and reward distribution
 
 import time
 import math
-from typing import Dict, List, Optional, Tuple
+import heapq
+import itertools
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -16,7 +19,7 @@ class BondStatus(Enum):
     UNBONDING = "unbonding"
     UNBONDED = "unbonded"
 
-@dataclass
+@dataclass(slots=True)
 class StakingPool:
     """Global staking pool information"""
     bonded_tokens: int
@@ -26,7 +29,7 @@ class StakingPool:
     def total_supply(self) -> int:
         return self.bonded_tokens + self.not_bonded_tokens
 
-@dataclass
+@dataclass(slots=True)
 class UnbondingDelegation:
     """Unbonding delegation entry"""
     delegator: str
@@ -35,8 +38,9 @@ class UnbondingDelegation:
     completion_time: float
     initial_balance: int
     balance: int
+    entry_id: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class Redelegation:
     """Redelegation entry"""
     delegator: str
@@ -46,16 +50,26 @@ class Redelegation:
     completion_time: float
     initial_balance: int
     shares_dst: float
+    entry_id: int = 0
 
 class StakingModule:
     """HYBRID blockchain staking system"""
     
     def __init__(self):
         self.pool = StakingPool(bonded_tokens=0, not_bonded_tokens=100_000_000_000 * 1_000_000)
-        self.delegations: Dict[Tuple[str, str], int] = {}  # (delegator, validator) -> amount
+        self.delegations: Dict[Tuple[str, str], int] = defaultdict(int)  # (delegator, validator) -> amount
+        self.by_validator: Dict[str, Dict[str, int]] = {}  # validator -> {delegator -> amount}
+        self.validator_total_bond: Dict[str, int] = defaultdict(int)  # validator -> total delegated amount
         self.unbonding_delegations: Dict[str, List[UnbondingDelegation]] = {}
         self.redelegations: Dict[str, List[Redelegation]] = {}
-        self.rewards: Dict[Tuple[str, str], int] = {}  # (delegator, validator) -> rewards
+        self.rewards: Dict[Tuple[str, str], int] = defaultdict(int)  # (delegator, validator) -> rewards
+        
+        # Maturity queues: min-heaps of (completion_time, entry_id) over live entries
+        self.unbonding_heap: List[Tuple[float, int]] = []
+        self.redelegation_heap: List[Tuple[float, int]] = []
+        self._unbonding_entries: Dict[int, UnbondingDelegation] = {}
+        self._redelegation_entries: Dict[int, Redelegation] = {}
+        self._entry_ids = itertools.count(1)
         
         # Staking parameters
         self.unbonding_time = 21 * 24 * 3600  # 21 days
@@ -85,14 +99,31 @@ class StakingModule:
         
         # Update delegation
         key = (delegator, validator)
-        self.delegations[key] = self.delegations.get(key, 0) + amount
+        self._adjust_delegation(delegator, validator, amount)
         
         # Initialize rewards
-        if key not in self.rewards:
-            self.rewards[key] = 0
+        self.rewards.setdefault(key, 0)
         
         return True
     
+    def _adjust_delegation(self, delegator: str, validator: str, delta: int):
+        """Apply a delegation change and keep the per-validator indexes in sync"""
+        key = (delegator, validator)
+        self.delegations[key] += delta
+        amount = self.delegations[key]
+        validator_delegations = self.by_validator.setdefault(validator, {})
+        
+        if amount == 0:
+            del self.delegations[key]
+            validator_delegations.pop(delegator, None)
+        else:
+            validator_delegations[delegator] = amount
+        
+        self.validator_total_bond[validator] += delta
+        if not validator_delegations:
+            del self.by_validator[validator]
+            del self.validator_total_bond[validator]
+    
     def undelegate(self, delegator: str, validator: str, amount: int) -> bool:
         """Start unbonding delegation"""
         key = (delegator, validator)
@@ -108,9 +139,7 @@ class StakingModule:
             return False
         
         # Update delegation
-        self.delegations[key] -= amount
-        if self.delegations[key] == 0:
-            del self.delegations[key]
+        self._adjust_delegation(delegator, validator, -amount)
         
         # Create unbonding entry
         unbonding = UnbondingDelegation(
@@ -119,20 +148,22 @@ class StakingModule:
             creation_height=0,  # Would be actual block height
             completion_time=time.time() + self.unbonding_time,
             initial_balance=amount,
-            balance=amount
+            balance=amount,
+            entry_id=next(self._entry_ids)
         )
         
         if delegator not in self.unbonding_delegations:
             self.unbonding_delegations[delegator] = []
         
         self.unbonding_delegations[delegator].append(unbonding)
+        self._unbonding_entries[unbonding.entry_id] = unbonding
+        heapq.heappush(self.unbonding_heap, (unbonding.completion_time, unbonding.entry_id))
         
         return True
     
     def redelegate(self, delegator: str, validator_src: str, validator_dst: str, amount: int) -> bool:
         """Redelegate tokens from one validator to another"""
         src_key = (delegator, validator_src)
-        dst_key = (delegator, validator_dst)
         
         current_src_delegation = self.delegations.get(src_key, 0)
         
@@ -147,11 +178,8 @@ class StakingModule:
             return False
         
         # Update delegations
-        self.delegations[src_key] -= amount
-        if self.delegations[src_key] == 0:
-            del self.delegations[src_key]
-        
-        self.delegations[dst_key] = self.delegations.get(dst_key, 0) + amount
+        self._adjust_delegation(delegator, validator_src, -amount)
+        self._adjust_delegation(delegator, validator_dst, amount)
         
         # Create redelegation entry
         redelegation = Redelegation(
@@ -161,13 +189,16 @@ class StakingModule:
             creation_height=0,  # Would be actual block height
             completion_time=time.time() + self.unbonding_time,
             initial_balance=amount,
-            shares_dst=float(amount)  # Simplified: 1:1 token to share ratio
+            shares_dst=float(amount),  # Simplified: 1:1 token to share ratio
+            entry_id=next(self._entry_ids)
         )
         
         if delegator not in self.redelegations:
             self.redelegations[delegator] = []
         
         self.redelegations[delegator].append(redelegation)
+        self._redelegation_entries[redelegation.entry_id] = redelegation
+        heapq.heappush(self.redelegation_heap, (redelegation.completion_time, redelegation.entry_id))
         
         return True
     
@@ -183,9 +214,7 @@ class StakingModule:
         for unbonding in self.unbonding_delegations[delegator]:
             if current_time >= unbonding.completion_time:
                 # Complete unbonding
-                completed_amount += unbonding.balance
-                self.pool.bonded_tokens -= unbonding.balance
-                self.pool.not_bonded_tokens += unbonding.balance
+                completed_amount += self._release_unbonding(unbonding)
             else:
                 remaining.append(unbonding)
         
@@ -206,6 +235,8 @@ class StakingModule:
         for redelegation in self.redelegations[delegator]:
             if current_time < redelegation.completion_time:
                 remaining.append(redelegation)
+            else:
+                self._redelegation_entries.pop(redelegation.entry_id, None)
         
         self.redelegations[delegator] = remaining
         if not remaining:
@@ -213,21 +244,97 @@ class StakingModule:
         
         return True
     
-    def distribute_rewards(self, validator: str, rewards_amount: int):
-        """Distribute rewards to a validator's delegators"""
-        # Find all delegations to this validator
-        validator_delegations = {k: v for k, v in self.delegations.items() if k[1] == validator}
+    def _release_unbonding(self, unbonding: UnbondingDelegation) -> int:
+        """Return a matured unbonding entry's balance to the unbonded pool"""
+        self._unbonding_entries.pop(unbonding.entry_id, None)
+        self.pool.bonded_tokens -= unbonding.balance
+        self.pool.not_bonded_tokens += unbonding.balance
+        return unbonding.balance
+    
+    def complete_unbonding_sweep(self, now: Optional[float] = None) -> int:
+        """Complete every matured unbonding entry across all delegators"""
+        now = time.time() if now is None else now
+        completed_amount = 0
+        
+        while self.unbonding_heap and self.unbonding_heap[0][0] <= now:
+            _, entry_id = heapq.heappop(self.unbonding_heap)
+            unbonding = self._unbonding_entries.get(entry_id)
+            if unbonding is None:
+                continue  # Already completed through complete_unbonding
+            
+            completed_amount += self._release_unbonding(unbonding)
+            entries = self.unbonding_delegations[unbonding.delegator]
+            entries.remove(unbonding)
+            if not entries:
+                del self.unbonding_delegations[unbonding.delegator]
+        
+        return completed_amount
+    
+    def complete_redelegation_sweep(self, now: Optional[float] = None) -> int:
+        """Complete every matured redelegation across all delegators"""
+        now = time.time() if now is None else now
+        completed = 0
+        
+        while self.redelegation_heap and self.redelegation_heap[0][0] <= now:
+            _, entry_id = heapq.heappop(self.redelegation_heap)
+            redelegation = self._redelegation_entries.pop(entry_id, None)
+            if redelegation is None:
+                continue  # Already completed through complete_redelegation
+            
+            completed += 1
+            entries = self.redelegations[redelegation.delegator]
+            entries.remove(redelegation)
+            if not entries:
+                del self.redelegations[redelegation.delegator]
+        
+        return completed
+    
+    def distribute_rewards(self, validator: str, rewards_amount: int) -> int:
+        """Distribute rewards to a validator's delegators, returning the amount credited"""
+        validator_delegations = self.by_validator.get(validator)
         
         if not validator_delegations:
-            return
+            return 0
         
-        total_delegation = sum(validator_delegations.values())
+        total_delegation = self.validator_total_bond[validator]
+        rewards = self.rewards
         
-        # Distribute proportionally
-        for (delegator, val), amount in validator_delegations.items():
-            delegation_reward = int((amount / total_delegation) * rewards_amount)
+        # Distribute proportionally with exact integer math, in deterministic address order
+        remaining = rewards_amount
+        top_delegator, top_amount = None, -1
+        for delegator in sorted(validator_delegations):
+            amount = validator_delegations[delegator]
+            delegation_reward = (amount * rewards_amount) // total_delegation
             key = (delegator, validator)
-            self.rewards[key] = self.rewards.get(key, 0) + delegation_reward
+            rewards[key] += delegation_reward
+            remaining -= delegation_reward
+            if amount > top_amount:
+                top_delegator, top_amount = delegator, amount
+        
+        # Rounding dust goes to the largest delegator so no reward is lost
+        if remaining:
+            rewards[(top_delegator, validator)] += remaining
+        
+        return rewards_amount
+    
+    def distribute_epoch_rewards(self, validator_rewards: Dict[str, int]) -> Dict[str, Any]:
+        """Distribute a whole epoch's rewards across validators in one pass"""
+        inflation_rate = self.calculate_inflation()
+        distributed = 0
+        validators_rewarded = 0
+        
+        # Validators are processed in address order so epoch results are deterministic
+        for validator in sorted(validator_rewards):
+            credited = self.distribute_rewards(validator, validator_rewards[validator])
+            if credited:
+                distributed += credited
+                validators_rewarded += 1
+        
+        return {
+            "inflation_rate": inflation_rate,
+            "validators_rewarded": validators_rewarded,
+            "total_distributed": distributed
+        }
     
     def withdraw_rewards(self, delegator: str, validator: str) -> int:
         """Withdraw accumulated rewards"""
@@ -266,8 +373,7 @@ class StakingModule:
     
     def get_validator_delegations(self, validator: str) -> Dict[str, int]:
         """Get all delegations to a validator"""
-        return {delegator: amount for (delegator, val), amount in self.delegations.items() 
-                if val == validator}
+        return dict(self.by_validator.get(validator, {}))
     
     def get_rewards(self, delegator: str, validator: str) -> int:
         """Get accumulated rewards"""
@@ -2,7 +2,9 @@
 import asyncio
 import json
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Union
+from graphlib import TopologicalSorter
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Union
 from enum import Enum
 import time
 import hashlib
@@ -19,7 +21,7 @@ class SystemLayer(Enum):
     TRUST_ENGINE = "trust_engine"       # SpiralScript trust system
     HOLOGRAPHIC = "holographic"         # 3D visualization layer
 
-@dataclass
+@dataclass(slots=True)
 class SystemComponent:
     """Base system component with lifecycle management"""
     name: str
@@ -56,8 +58,11 @@ class HybridSystemArchitecture:
     
     def __init__(self):
         self.components: Dict[str, SystemComponent] = {}
+        self._dependency_graph: Dict[str, List[str]] = {}
+        self._dependency_view = MappingProxyType(self._dependency_graph)
         self.layers: Dict[SystemLayer, List[SystemComponent]] = {layer: [] for layer in SystemLayer}
         self.system_state = "initializing"
+        self._earliest_start_time: Optional[float] = None
         self.startup_sequence = [
             SystemLayer.FOUNDATION,
             SystemLayer.CONSENSUS,
@@ -177,47 +182,59 @@ class HybridSystemArchitecture:
     def register_component(self, component: SystemComponent):
         """Register a component in the system"""
         self.components[component.name] = component
+        self._dependency_graph[component.name] = component.dependencies
         self.layers[component.layer].append(component)
     
     async def startup_system(self):
         """Start the entire system in proper order"""
         self.system_state = "starting"
         
-        for layer in self.startup_sequence:
-            print(f"🚀 Starting {layer.value} layer...")
+        # Components whose dependencies have all been started are initialized
+        # together; the layer sequence only orders log output within a stage.
+        # prepare() raises graphlib.CycleError for circular dependencies.
+        layer_rank = {layer: rank for rank, layer in enumerate(self.startup_sequence)}
+        sorter = TopologicalSorter(self.get_component_dependencies())
+        sorter.prepare()
+        not_started = dict.fromkeys(self.components)
+        stage_number = 0
+        
+        while sorter.is_active():
+            ready = sorter.get_ready()
+            # Unregistered dependency names are never marked done, so anything
+            # depending on them is left blocked rather than started
+            stage = sorted(
+                (self.components[name] for name in ready if name in self.components),
+                key=lambda c: layer_rank.get(c.layer, len(layer_rank))
+            )
+            if not stage:
+                break
+            stage_number += 1
+            print(f"🚀 Starting stage {stage_number} ({len(stage)} components)...")
             
-            # Start all components in this layer
-            layer_components = self.layers[layer]
-            for component in layer_components:
-                # Check dependencies
-                if self._check_dependencies(component):
-                    success = component.initialize()
-                    if success:
-                        print(f"  ✅ {component.name} started")
-                        component.metrics["start_time"] = time.time()
-                    else:
-                        print(f"  ❌ {component.name} failed to start")
-                        self.system_state = "error"
-                        return False
+            results = await asyncio.gather(*(asyncio.to_thread(c.initialize) for c in stage))
+            for component, success in zip(stage, results):
+                if success:
+                    print(f"  ✅ {component.name} started")
+                    start_time = time.time()
+                    component.metrics["start_time"] = start_time
+                    if self._earliest_start_time is None or start_time < self._earliest_start_time:
+                        self._earliest_start_time = start_time
+                    del not_started[component.name]
+                    sorter.done(component.name)
                 else:
-                    print(f"  ⏳ {component.name} waiting for dependencies")
-                    component.status = "waiting"
-            
-            # Brief pause between layers
-            await asyncio.sleep(0.5)
+                    print(f"  ❌ {component.name} failed to start")
+                    self.system_state = "error"
+            if self.system_state == "error":
+                return False
+        
+        for name in not_started:
+            print(f"  ⏳ {name} waiting for dependencies")
+            self.components[name].status = "waiting"
         
         self.system_state = "running"
         print("🌟 HYBRID Blockchain System fully operational!")
         return True
     
-    def _check_dependencies(self, component: SystemComponent) -> bool:
-        """Check if component dependencies are met"""
-        for dep_name in component.dependencies:
-            dep_component = self.components.get(dep_name)
-            if not dep_component or dep_component.status != "active":
-                return False
-        return True
-    
     def get_system_health(self) -> Dict[str, Any]:
         """Get comprehensive system health report"""
         layer_health = {}
@@ -238,12 +255,12 @@ class HybridSystemArchitecture:
             "active_components": active_components,
             "total_components": total_components,
             "layer_health": layer_health,
-            "uptime": time.time() - min(c.metrics.get("start_time", time.time()) for c in self.components.values() if c.status == "active")
+            "uptime": time.time() - self._earliest_start_time if self._earliest_start_time is not None else 0.0
         }
     
-    def get_component_dependencies(self) -> Dict[str, List[str]]:
-        """Get component dependency graph"""
-        return {name: component.dependencies for name, component in self.components.items()}
+    def get_component_dependencies(self) -> Mapping[str, List[str]]:
+        """Get component dependency graph (read-only view kept current by register_component)"""
+        return self._dependency_view
 
 # Global system architecture instance
 hybrid_system = HybridSystemArchitecture()
@@ -5,10 +5,14 @@ Manages pending transactions and mempool
 """
 
 import asyncio
+import bisect
 import time
 import hashlib
-from typing import Dict, List, Optional, Set
-from dataclasses import dataclass
+import heapq
+import struct
+from collections import Counter, OrderedDict, defaultdict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 import json
@@ -23,7 +27,7 @@ class TransactionType(Enum):
     BRIDGE = "bridge"
     GOVERNANCE = "governance"
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     """HYBRID blockchain transaction"""
     hash: str
@@ -39,6 +43,11 @@ class Transaction:
     timestamp: float
     signature: str
     memo: str = ""
+    fee_per_gas: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Fee priority key, computed once instead of on every queue operation
+        self.fee_per_gas = self.fee / self.gas_limit if self.gas_limit > 0 else 0.0
     
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
@@ -61,12 +70,31 @@ class Transaction:
 class TransactionPool:
     """Transaction pool for managing pending transactions"""
     
-    def __init__(self, max_size: int = 10000):
+    def __init__(self, max_size: int = 10000, cache_size: int = 100_000):
         self.pending_transactions: Dict[str, Transaction] = {}
-        self.address_nonces: Dict[str, int] = {}
+        # Next nonce after each address's last included transaction, and the
+        # sorted nonces it still has pending in the pool
+        self._confirmed_nonces: Dict[str, int] = {}
+        self._pending_nonces: Dict[str, List[int]] = {}
         self.max_size = max_size
-        self.fee_priority_queue: List[Transaction] = []
-        self.transaction_cache: Dict[str, Transaction] = {}
+        
+        # Recently included transactions, least recently used first
+        self.transaction_cache: "OrderedDict[str, Transaction]" = OrderedDict()
+        self._cache_cap = cache_size
+        
+        # Fee priority heaps with lazy deletion; entries are only live while
+        # their sequence number matches _entry_seq for that hash
+        self._heap: List[Tuple[float, int, str]] = []  # (-fee_per_gas, seq, hash): highest fee first
+        self._low_heap: List[Tuple[float, int, str]] = []  # (fee_per_gas, -seq, hash): eviction order
+        self._entry_seq: Dict[str, int] = {}
+        self._seq = 0
+        
+        # Running aggregates over pending transactions for get_pool_stats
+        self._total_fees = 0
+        self._type_counts: Counter = Counter()
+        
+        # Inverted index of address -> hashes of its pending and cached transactions
+        self._by_address: Dict[str, Set[str]] = defaultdict(set)
         
     def add_transaction(self, tx: Transaction) -> bool:
         """Add transaction to pool"""
@@ -79,19 +107,68 @@ class TransactionPool:
             return False
         
         # Check nonce
-        expected_nonce = self.address_nonces.get(tx.from_address, 0)
+        expected_nonce = self.expected_nonce(tx.from_address)
         if tx.nonce != expected_nonce:
             return False
         
         # Add to pool
         self.pending_transactions[tx.hash] = tx
-        self.address_nonces[tx.from_address] = tx.nonce + 1
+        self._track_added(tx)
         
         # Add to priority queue
         self._insert_by_fee(tx)
         
         return True
     
+    def _track_added(self, tx: Transaction):
+        """Update running pool aggregates for a newly pending transaction"""
+        self._total_fees += tx.fee
+        self._type_counts[tx.tx_type.value] += 1
+        self._by_address[tx.from_address].add(tx.hash)
+        self._by_address[tx.to_address].add(tx.hash)
+        bisect.insort(self._pending_nonces.setdefault(tx.from_address, []), tx.nonce)
+    
+    def _track_removed(self, tx: Transaction):
+        """Update running pool aggregates for a transaction leaving the pool"""
+        self._total_fees -= tx.fee
+        tx_type = tx.tx_type.value
+        self._type_counts[tx_type] -= 1
+        if not self._type_counts[tx_type]:
+            del self._type_counts[tx_type]
+        
+        # Drop exactly this transaction's nonce, whatever its position
+        nonces = self._pending_nonces.get(tx.from_address)
+        if nonces:
+            i = bisect.bisect_left(nonces, tx.nonce)
+            if i < len(nonces) and nonces[i] == tx.nonce:
+                del nonces[i]
+            if not nonces:
+                del self._pending_nonces[tx.from_address]
+    
+    def expected_nonce(self, address: str) -> int:
+        """Next nonce the pool will accept from an address"""
+        confirmed = self._confirmed_nonces.get(address, 0)
+        nonces = self._pending_nonces.get(address)
+        if nonces:
+            return max(nonces[-1] + 1, confirmed)
+        return confirmed
+    
+    def _unindex_address(self, tx: Transaction):
+        """Drop a transaction that left both pool and cache from the address index"""
+        for address in (tx.from_address, tx.to_address):
+            hashes = self._by_address.get(address)
+            if hashes is not None:
+                hashes.discard(tx.hash)
+                if not hashes:
+                    del self._by_address[address]
+    
+    def _lookup(self, tx_hash: str) -> Optional[Transaction]:
+        """Resolve a hash against pending transactions, then the cache"""
+        tx = self.pending_transactions.get(tx_hash)
+        if tx is None:
+            tx = self.transaction_cache.get(tx_hash)
+        return tx
+    
     def _validate_transaction(self, tx: Transaction) -> bool:
         """Validate transaction"""
         # Basic validation
@@ -112,30 +189,53 @@ class TransactionPool:
     
     def _insert_by_fee(self, tx: Transaction):
         """Insert transaction in fee priority order"""
-        fee_per_gas = tx.fee / tx.gas_limit
+        fee_per_gas = tx.fee_per_gas
+        seq = self._seq
+        self._seq += 1
         
-        # Binary search insertion
-        left, right = 0, len(self.fee_priority_queue)
-        while left < right:
-            mid = (left + right) // 2
-            mid_fee_per_gas = self.fee_priority_queue[mid].fee / self.fee_priority_queue[mid].gas_limit
-            if fee_per_gas > mid_fee_per_gas:
-                right = mid
-            else:
-                left = mid + 1
+        self._entry_seq[tx.hash] = seq
+        heapq.heappush(self._heap, (-fee_per_gas, seq, tx.hash))
+        # Among equal fees the most recently added transaction is evicted first
+        heapq.heappush(self._low_heap, (fee_per_gas, -seq, tx.hash))
+    
+    def _discard_from_queue(self, tx_hash: str):
+        """Tombstone a transaction in the fee priority heaps"""
+        self._entry_seq.pop(tx_hash, None)
+    
+    def _compact_queue(self):
+        """Rebuild a heap once more than a quarter of its entries are tombstones"""
+        live = self._entry_seq
+        
+        if len(self._heap) - len(live) > len(self._heap) // 4:
+            self._heap = [entry for entry in self._heap if live.get(entry[2]) == entry[1]]
+            heapq.heapify(self._heap)
         
-        self.fee_priority_queue.insert(left, tx)
+        if len(self._low_heap) - len(live) > len(self._low_heap) // 4:
+            self._low_heap = [entry for entry in self._low_heap if live.get(entry[2]) == -entry[1]]
+            heapq.heapify(self._low_heap)
+    
+    def _iter_by_fee(self) -> Iterator[Transaction]:
+        """Yield pending transactions from highest to lowest fee per gas"""
+        heap = list(self._heap)
+        while heap:
+            _, seq, tx_hash = heapq.heappop(heap)
+            if self._entry_seq.get(tx_hash) == seq:
+                yield self.pending_transactions[tx_hash]
     
     def _evict_lowest_fee_tx(self):
         """Remove transaction with lowest fee"""
-        if not self.fee_priority_queue:
+        while self._low_heap:
+            _, neg_seq, tx_hash = heapq.heappop(self._low_heap)
+            if self._entry_seq.get(tx_hash) == -neg_seq:
+                break
+        else:
             return
         
-        lowest_fee_tx = self.fee_priority_queue.pop()
-        del self.pending_transactions[lowest_fee_tx.hash]
-        
-        # Adjust nonce
-        self.address_nonces[lowest_fee_tx.from_address] -= 1
+        del self._entry_seq[tx_hash]
+        lowest_fee_tx = self.pending_transactions.pop(tx_hash)
+        self._track_removed(lowest_fee_tx)
+        self._unindex_address(lowest_fee_tx)
+        self._compact_queue()
     
     def get_transactions_for_block(self, max_transactions: int = 1000, max_gas: int = 20_000_000) -> List[Transaction]:
         """Get transactions for next block"""
@@ -143,7 +243,7 @@ class TransactionPool:
         total_gas = 0
         used_addresses = set()
         
-        for tx in self.fee_priority_queue:
+        for tx in self._iter_by_fee():
             # Skip if address already used in this block
             if tx.from_address in used_addresses:
                 continue
@@ -168,12 +268,28 @@ class TransactionPool:
             if tx_hash in self.pending_transactions:
                 tx = self.pending_transactions[tx_hash]
                 del self.pending_transactions[tx_hash]
+                self._track_removed(tx)
+                
+                # Included nonces stay consumed after leaving the pool
+                confirmed = self._confirmed_nonces.get(tx.from_address, 0)
+                self._confirmed_nonces[tx.from_address] = max(confirmed, tx.nonce + 1)
                 
                 # Remove from priority queue
-                self.fee_priority_queue = [t for t in self.fee_priority_queue if t.hash != tx_hash]
+                self._discard_from_queue(tx_hash)
                 
                 # Cache transaction
-                self.transaction_cache[tx_hash] = tx
+                self._cache_transaction(tx)
+        
+        self._compact_queue()
+    
+    def _cache_transaction(self, tx: Transaction):
+        """Insert into the bounded cache, dropping least recently used entries"""
+        self.transaction_cache[tx.hash] = tx
+        self.transaction_cache.move_to_end(tx.hash)
+        while len(self.transaction_cache) > self._cache_cap:
+            tx_hash, stale = self.transaction_cache.popitem(last=False)
+            if tx_hash not in self.pending_transactions:
+                self._unindex_address(stale)
     
     def get_transaction(self, tx_hash: str) -> Optional[Transaction]:
         """Get transaction by hash"""
@@ -182,7 +298,10 @@ class TransactionPool:
             return self.pending_transactions[tx_hash]
         
         # Check cache
-        return self.transaction_cache.get(tx_hash)
+        tx = self.transaction_cache.get(tx_hash)
+        if tx is not None:
+            self.transaction_cache.move_to_end(tx_hash)
+        return tx
     
     def get_pending_count(self) -> int:
         """Get number of pending transactions"""
@@ -190,35 +309,24 @@ class TransactionPool:
     
     def get_address_transactions(self, address: str) -> List[Transaction]:
         """Get all transactions for an address"""
-        transactions = []
-        
-        # Pending transactions
-        for tx in self.pending_transactions.values():
-            if tx.from_address == address or tx.to_address == address:
-                transactions.append(tx)
-        
-        # Cached transactions
-        for tx in self.transaction_cache.values():
-            if tx.from_address == address or tx.to_address == address:
-                transactions.append(tx)
-        
-        return sorted(transactions, key=lambda x: x.timestamp, reverse=True)
+        hashes = self._by_address.get(address, ())
+        transactions = (self._lookup(tx_hash) for tx_hash in hashes)
+        return sorted(
+            (tx for tx in transactions if tx is not None),
+            key=lambda x: x.timestamp,
+            reverse=True
+        )
     
     def get_pool_stats(self) -> Dict:
         """Get transaction pool statistics"""
-        total_fees = sum(tx.fee for tx in self.pending_transactions.values())
+        total_fees = self._total_fees
         avg_fee = total_fees / len(self.pending_transactions) if self.pending_transactions else 0
         
-        type_distribution = {}
-        for tx in self.pending_transactions.values():
-            tx_type = tx.tx_type.value
-            type_distribution[tx_type] = type_distribution.get(tx_type, 0) + 1
-        
         return {
             "pending_count": len(self.pending_transactions),
             "total_fees": total_fees,
             "average_fee": avg_fee,
-            "type_distribution": type_distribution,
+            "type_distribution": dict(self._type_counts),
             "max_size": self.max_size,
             "cached_transactions": len(self.transaction_cache)
         }
@@ -236,12 +344,40 @@ class TransactionPool:
         for tx_hash in old_hashes:
             tx = self.pending_transactions[tx_hash]
             del self.pending_transactions[tx_hash]
-            self.fee_priority_queue = [t for t in self.fee_priority_queue if t.hash != tx_hash]
-            
-            # Adjust nonce
-            self.address_nonces[tx.from_address] -= 1
+            self._track_removed(tx)
+            self._unindex_address(tx)
+            self._discard_from_queue(tx_hash)
+        
+        self._compact_queue()
 
-def create_transaction(
+def _micro_units(name: str, value: Any) -> int:
+    """Coerce an amount or fee to whole micro-HYBRID for the fixed-width hash preimage"""
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        if value.is_integer():
+            return int(value)
+        raise ValueError(f"{name} must be a whole number of micro-HYBRID, got {value!r}")
+    raise TypeError(f"{name} must be an int of micro-HYBRID, got {type(value).__name__}")
+
+def _transaction_hash(
+    from_address: str,
+    to_address: str,
+    amount: int,
+    fee: int,
+    timestamp: float,
+    nonce: int
+) -> str:
+    """Hash the transaction preimage from fixed-width fields"""
+    h = hashlib.sha256()
+    h.update(from_address.encode())
+    h.update(to_address.encode())
+    h.update(amount.to_bytes(16, "big", signed=True))
+    h.update(fee.to_bytes(16, "big", signed=True))
+    h.update(struct.pack(">dQ", timestamp, nonce))
+    return "0x" + h.hexdigest()
+
+def _build_transaction(
     from_address: str,
     to_address: str,
     amount: int,
@@ -250,13 +386,13 @@ def create_transaction(
     data: str = "",
     memo: str = ""
 ) -> Transaction:
-    """Create a new transaction"""
+    amount = _micro_units("amount", amount)
+    fee = _micro_units("fee", fee)
     timestamp = time.time()
     nonce = 0  # Would be fetched from account state
     
     # Create transaction hash
-    tx_data = f"{from_address}{to_address}{amount}{fee}{timestamp}{nonce}"
-    tx_hash = f"0x{hashlib.sha256(tx_data.encode()).hexdigest()}"
+    tx_hash = _transaction_hash(from_address, to_address, amount, fee, timestamp, nonce)
     
     # Calculate gas
     base_gas = 21000
@@ -279,5 +415,21 @@ def create_transaction(
         memo=memo
     )
 
+def create_transaction(
+    from_address: str,
+    to_address: str,
+    amount: int,
+    fee: int,
+    tx_type: TransactionType = TransactionType.TRANSFER,
+    data: str = "",
+    memo: str = ""
+) -> Transaction:
+    """Create a new transaction; amount and fee are whole micro-HYBRID (integral floats are coerced)"""
+    return _build_transaction(from_address, to_address, amount, fee, tx_type, data, memo)
+
+def create_transactions(specs: Iterable[Dict[str, Any]]) -> List[Transaction]:
+    """Create transactions in bulk from create_transaction keyword arguments"""
+    return [_build_transaction(**spec) for spec in specs]
+
 # Global transaction pool
 transaction_pool = TransactionPool()
@@ -6,13 +6,70 @@ Derived from mathematical truth - specifically the 6 remaining millennium proble
 """
 
 import numpy as np
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
-from decimal import Decimal
-import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple, Union
+from dataclasses import dataclass, field
+from enum import Enum
+from operator import itemgetter
+import functools
+import hashlib
 import json
+import math
+import os
+import struct
+import sys
+import time
+
+# Shared string constants repeated across every unit, vault and result
+_RESONANCE = sys.intern("∞ Hz")
+_SOVEREIGN_ONLY = sys.intern("SOVEREIGN_ONLY")
+
+# Sovereign signature shape: the prefix plus enough material to exceed 20 characters
+_SOVEREIGN_PREFIX = "SOVEREIGN_"
+_MIN_SIGNATURE_LENGTH = 21
+
+class _Unlimited:
+    """Sentinel for reserves and capacities that have no upper bound"""
+    __slots__ = ()
+    
+    def __repr__(self):
+        return "∞"
+    
+    def __reduce__(self):
+        # Unpickles to the module singleton so identity checks hold in workers
+        return "UNLIMITED"
+
+UNLIMITED = _Unlimited()
+
+class TrustJSONEncoder(json.JSONEncoder):
+    """JSON encoder for vaults and proofs holding UNLIMITED, which serializes as the string infinite
+    
+    Result dicts never carry the sentinel and serialize with the stock encoder.
+    Read-only mappings such as the vault tables serialize as objects.
+    """
+    
+    def default(self, o):
+        if o is UNLIMITED:
+            return "infinite"
+        if isinstance(o, Mapping):
+            return dict(o)
+        return super().default(o)
+
+class TrustMetric(Enum):
+    RIEMANN_HYPOTHESIS = "riemann_hypothesis"
+    YANG_MILLS = "yang_mills"
+    P_VS_NP = "p_vs_np"
+    HODGE_CONJECTURE = "hodge_conjecture"
+    POINCARE_CONJECTURE = "poincare_conjecture"  # Solved by Perelman
+    BIRCH_SWINNERTON_DYR = "birch_swinnerton_dyr"
 
-@dataclass
+class CurrencyType(Enum):
+    TRUST_TOKEN = "trust_token"
+    SOVEREIGN_UNIT = "sovereign_unit"
+    MATHEMATICAL_PROOF = "mathematical_proof"
+
+@dataclass(frozen=True, slots=True)
 class TrustUnit:
     """Private Sovereign Trust Currency units - NOT for public use"""
     amount: float  # Infinite from mathematical proof validation
@@ -23,13 +80,274 @@ class TrustUnit:
     truth_quotient: float  # Level of mathematical certainty
     lawful_private: bool = True  # Always private and lawful
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MathematicalProof:
     """Software representation of mathematical truth"""
     name: str
     solution: str
     verification_status: bool
-    trust_generation_capacity: float  # Can be infinite
+    trust_generation_capacity: Union[float, _Unlimited]  # Can be UNLIMITED
+    unlimited: bool = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Proof text is copied into every unit and result row; share one object
+        object.__setattr__(self, 'name', sys.intern(self.name))
+        object.__setattr__(self, 'solution', sys.intern(self.solution))
+        # Unlimited capacity never clamps a request, so generation can skip min()
+        object.__setattr__(self, 'unlimited', self.trust_generation_capacity is UNLIMITED)
+
+@dataclass(frozen=True, slots=True)
+class TrustTransaction:
+    """Private trust currency transaction"""
+    id: str
+    amount: float
+    currency_type: CurrencyType
+    trust_metric: TrustMetric
+    mathematical_proof: str
+    timestamp: int  # Nanoseconds since the epoch (time.time_ns)
+    is_sovereign: bool = True
+
+# Ledger columns store enum members as small integer codes into these tables
+_METRICS: Tuple[TrustMetric, ...] = tuple(TrustMetric)
+_METRIC_CODES: Mapping[TrustMetric, int] = MappingProxyType({metric: code for code, metric in enumerate(_METRICS)})
+_CURRENCY_TYPES: Tuple[CurrencyType, ...] = tuple(CurrencyType)
+_CURRENCY_CODES: Mapping[CurrencyType, int] = MappingProxyType({kind: code for code, kind in enumerate(_CURRENCY_TYPES)})
+
+# Initial row capacity of the minting ledger; doubled whenever it fills
+_LEDGER_INITIAL_CAPACITY = 64
+
+# Static proof data shared read-only by every engine instance
+
+# Six Remaining Millennium Problems as Private Trust Vaults
+_MILLENNIUM_VAULTS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    'riemann_vault': MappingProxyType({'reserves': UNLIMITED, 'proof': 'Riemann Hypothesis', 'access': _SOVEREIGN_ONLY}),
+    'complexity_vault': MappingProxyType({'reserves': UNLIMITED, 'proof': 'P vs NP', 'access': _SOVEREIGN_ONLY}),
+    'fluid_vault': MappingProxyType({'reserves': UNLIMITED, 'proof': 'Navier-Stokes', 'access': _SOVEREIGN_ONLY}),
+    'gauge_vault': MappingProxyType({'reserves': UNLIMITED, 'proof': 'Yang-Mills', 'access': _SOVEREIGN_ONLY}),
+    'elliptic_vault': MappingProxyType({'reserves': UNLIMITED, 'proof': 'Birch-Swinnerton-Dyer', 'access': _SOVEREIGN_ONLY}),
+    'hodge_vault': MappingProxyType({'reserves': UNLIMITED, 'proof': 'Hodge Conjecture', 'access': _SOVEREIGN_ONLY})
+})
+
+# Private mathematical truth validation for Sovereigns only
+_MILLENNIUM_VALIDATORS: Mapping[str, MathematicalProof] = MappingProxyType({
+    'riemann': MathematicalProof(
+        name="Riemann Hypothesis",
+        solution="All non-trivial zeros lie on Re(s) = 1/2",
+        verification_status=True,
+        trust_generation_capacity=UNLIMITED
+    ),
+    'p_vs_np': MathematicalProof(
+        name="P vs NP Problem", 
+        solution="P ≠ NP via quantum computational complexity analysis",
+        verification_status=True,
+        trust_generation_capacity=UNLIMITED
+    ),
+    'navier_stokes': MathematicalProof(
+        name="Navier-Stokes Equations",
+        solution="Smooth solutions exist globally",
+        verification_status=True,
+        trust_generation_capacity=UNLIMITED
+    ),
+    'yang_mills': MathematicalProof(
+        name="Yang-Mills Mass Gap",
+        solution="Mass gap exists and is provable",
+        verification_status=True,
+        trust_generation_capacity=UNLIMITED
+    ),
+    'birch_swinnerton_dyer': MathematicalProof(
+        name="Birch and Swinnerton-Dyer Conjecture",
+        solution="L-function order equals Mordell-Weil rank",
+        verification_status=True,
+        trust_generation_capacity=UNLIMITED
+    ),
+    'hodge': MathematicalProof(
+        name="Hodge Conjecture",
+        solution="Hodge classes are algebraic",
+        verification_status=True,
+        trust_generation_capacity=UNLIMITED
+    )
+})
+
+# Proof backings drawn on for UBI distribution and debt nullification
+_TRUST_BACKINGS: Mapping[str, MathematicalProof] = MappingProxyType({
+    'poincare': MathematicalProof(
+        name="Poincaré Conjecture",
+        solution="Poincaré Conjecture Solution",
+        verification_status=True,
+        trust_generation_capacity=UNLIMITED
+    ),
+    'millennium': MathematicalProof(
+        name="Seven Millennium Problems",
+        solution="Seven Millennium Problems Solutions",
+        verification_status=True,
+        trust_generation_capacity=UNLIMITED
+    )
+})
+
+# Proof names accepted as transaction backing
+_VALID_BACKINGS = frozenset(_MILLENNIUM_VALIDATORS)
+
+# Validators by position; PROOF_INDEX maps each proof name to its slot so
+# repeat callers can mint by index without hashing the name each time
+_VALIDATORS_BY_INDEX: Tuple[MathematicalProof, ...] = tuple(_MILLENNIUM_VALIDATORS.values())
+PROOF_INDEX: Mapping[str, int] = MappingProxyType({name: index for index, name in enumerate(_MILLENNIUM_VALIDATORS)})
+
+# Every accepted backing by position; trust backings shadow validators of the same name
+_BACKINGS: Mapping[str, MathematicalProof] = MappingProxyType({**_MILLENNIUM_VALIDATORS, **_TRUST_BACKINGS})
+_BACKINGS_BY_INDEX: Tuple[MathematicalProof, ...] = tuple(_BACKINGS.values())
+_BACKING_INDEX: Mapping[str, int] = MappingProxyType({name: index for index, name in enumerate(_BACKINGS)})
+
+_COHERENCE_RATE = 1.618  # Golden ratio governing trust generation
+
+@functools.lru_cache(maxsize=1024)
+def _trust_unit(backing_index: int, amount_requested: float) -> TrustUnit:
+    """Build the TrustUnit for a backing slot; identical requests share one unit"""
+    proof = _BACKINGS_BY_INDEX[backing_index]
+    return TrustUnit(
+        amount=amount_requested if proof.unlimited else min(amount_requested, proof.trust_generation_capacity),
+        millennium_proof=proof.solution,
+        sovereign_signature="",
+        coherence=_COHERENCE_RATE,
+        resonance=_RESONANCE,
+        truth_quotient=1.0,
+        lawful_private=True
+    )
+
+# validate_transaction result; only truth_verified and mathematical_backing vary
+_VALIDATION_TEMPLATE: Dict[str, Any] = {
+    'transaction_valid': True,
+    'truth_verified': False,
+    'coherence_maintained': True,
+    'resonance_frequency': _RESONANCE,
+    'trust_quotient': 1.618,
+    'mathematical_backing': None,
+    'infinite_liquidity': True
+}
+
+# Packed TrustUnit records produced by generate_trust_currency_batch; batch
+# generation is a system operation, so there is no sovereign_signature column
+_TRUST_UNIT_DTYPE = np.dtype([
+    ('amount', 'f8'),
+    ('millennium_proof', f"U{max(len(p.solution) for p in (*_MILLENNIUM_VALIDATORS.values(), *_TRUST_BACKINGS.values()))}"),
+    ('coherence', 'f8'),
+    ('resonance', 'U8'),
+    ('truth_quotient', 'f8'),
+    ('lawful_private', '?'),
+])
+
+# Result templates for the bulk operations; per-call fields are filled into a copy
+_UBI_RESULT_TEMPLATE: Dict[str, Any] = {
+    'total_recipients': 0,
+    'amount_per_recipient': 0,
+    'total_distributed': 0,
+    'backing_source': 'Poincaré Conjecture Solution',
+    'distribution_results': None,
+    'infinite_reserves': True
+}
+
+_NULLIFY_RESULT_TEMPLATE: Dict[str, Any] = {
+    'total_accounts_processed': 0,
+    'total_debt_nullified': 0,
+    'backing_source': 'Seven Millennium Problems Solutions',
+    'nullification_results': None,
+    'infinite_reserves': True
+}
+
+_pack_amount = struct.Struct('<d').pack
+# Per-row mint proof input: amount and ledger position
+_pack_mint_row = struct.Struct('<dQ').pack
+# Mint timestamp in nanoseconds, appended to the shared proof prefix
+_pack_timestamp = struct.Struct('<Q').pack
+
+def _unit_seed(prefix: bytes, amount: float, backing: str) -> bytes:
+    """Digest seed binding a transaction kind to the unit it pays out"""
+    return prefix + _pack_amount(amount) + backing.encode()
+
+def _transaction_id(label: str, party: str, seed: bytes, index: int) -> str:
+    """Stable short transaction ID; index keeps repeated parties distinct"""
+    digest = hashlib.blake2b(seed + party.encode() + index.to_bytes(8, 'little'), digest_size=8).hexdigest()
+    return f"{label}-{party}-{digest}"
+
+# Bulk UBI / debt batches fan per-entry assembly out to worker processes past this size
+_PARALLEL_THRESHOLD = 10_000
+# Size the pool to the CPUs this process may run on, which containers and
+# taskset can restrict well below the host's cpu_count()
+try:
+    _BULK_WORKERS = len(os.sched_getaffinity(0)) or 1
+except AttributeError:  # sched_getaffinity is Linux-only
+    _BULK_WORKERS = os.cpu_count() or 1
+_bulk_pool: Optional[ProcessPoolExecutor] = None
+
+def _run_sharded(assemble, columns: List[List[Any]], *args: Any) -> List[Any]:
+    """
+    Call assemble(*column_slices, *args, start) over contiguous shards and
+    concatenate the results; shards run in worker processes for large batches
+    """
+    global _bulk_pool
+    
+    n = len(columns[0])
+    if _BULK_WORKERS > 1 and n >= _PARALLEL_THRESHOLD:
+        if _bulk_pool is None:
+            _bulk_pool = ProcessPoolExecutor(max_workers=_BULK_WORKERS)
+        shard_size = -(-n // _BULK_WORKERS)
+        starts = range(0, n, shard_size)
+        chunks = _bulk_pool.map(
+            assemble,
+            *([column[i:i + shard_size] for i in starts] for column in columns),
+            *([arg] * len(starts) for arg in args),
+            starts
+        )
+        return [item for chunk in chunks for item in chunk]
+    return assemble(*columns, *args, 0)
+
+def _ubi_transaction_ids(recipients: List[str], seed: bytes, start: int = 0) -> List[str]:
+    """UBI transaction IDs for a contiguous slice of recipients beginning at index start"""
+    return [_transaction_id("UBI", recipient, seed, i) for i, recipient in enumerate(recipients, start)]
+
+def _nullification_rows(
+    debtor_ids: List[str],
+    debt_amounts: List[float],
+    payment_amounts: List[float],
+    backing_proof: str,
+    start: int = 0
+) -> List[Dict[str, Any]]:
+    """Result rows for a contiguous slice of debtor accounts beginning at index start"""
+    return [
+        {
+            'debtor_id': debtor_id,
+            'debt_amount': debt_amount,
+            'payment_amount': payment_amount,
+            'backing_proof': backing_proof,
+            'status': 'NULLIFIED',
+            'transaction_id': _transaction_id(
+                "DEBT-NULL", debtor_id, _unit_seed(b"DEBT-NULL-", payment_amount, backing_proof), i
+            )
+        }
+        for i, (debtor_id, debt_amount, payment_amount) in enumerate(
+            zip(debtor_ids, debt_amounts, payment_amounts), start
+        )
+    ]
+
+_debt_fields_fast = itemgetter('debt_amount', 'debtor_id')
+
+def _debt_fields(account: Dict[str, Any]) -> Tuple[float, str]:
+    """(debt_amount, debtor_id) for an account, defaulting missing fields"""
+    try:
+        return _debt_fields_fast(account)
+    except KeyError:
+        return account.get('debt_amount', 0), account.get('debtor_id', 'unknown')
+
+def _records_to_dicts(records: np.ndarray, repeated: Tuple[str, ...] = ()) -> List[Dict[str, Any]]:
+    """
+    Materialize a structured array as one dict per record; string fields named
+    in repeated are interned so rows share one object per distinct value
+    """
+    names = records.dtype.names
+    rows = [dict(zip(names, row)) for row in records.tolist()]
+    for name in repeated:
+        for row in rows:
+            row[name] = sys.intern(row[name])
+    return rows
 
 class TrustCurrencyEngine:
     """
@@ -43,98 +361,154 @@ class TrustCurrencyEngine:
     - Private, lawful sovereign operations only
     - Infinite supply from mathematical proof validation
     - No public access or distribution
+    
+    HYBRID Coin = Public blockchain currency (legal)
+    Trust Currency = Private sovereign currency (lawful)
     """
     
     def __init__(self):
         # PRIVATE SOVEREIGN MATHEMATICAL REPOSITORIES
         # NOT accessible to public, only to verified Sovereigns
         self.sovereign_access_only = True
-        self.mathematical_proof_vaults = self._initialize_millennium_vaults()
-        self.infinite_reserves = float('inf')  # From mathematical truth, not blockchain
-        self.coherence_rate = 1.618  # Golden ratio governing trust generation
-        self.millennium_validators = self._initialize_millennium_validators()
+        self.mathematical_proof_vaults = _MILLENNIUM_VAULTS
+        self.infinite_reserves = UNLIMITED  # From mathematical truth, not blockchain
+        self.coherence_rate = _COHERENCE_RATE
+        self.millennium_validators = _MILLENNIUM_VALIDATORS
+        self.trust_backings = _TRUST_BACKINGS
         
         # Six Remaining Millennium Problems as Private Trust Vaults
-        self.millennium_vaults = {
-            'riemann_vault': {'reserves': float('inf'), 'proof': 'Riemann Hypothesis', 'access': 'SOVEREIGN_ONLY'},
-            'complexity_vault': {'reserves': float('inf'), 'proof': 'P vs NP', 'access': 'SOVEREIGN_ONLY'},
-            'fluid_vault': {'reserves': float('inf'), 'proof': 'Navier-Stokes', 'access': 'SOVEREIGN_ONLY'},
-            'gauge_vault': {'reserves': float('inf'), 'proof': 'Yang-Mills', 'access': 'SOVEREIGN_ONLY'},
-            'elliptic_vault': {'reserves': float('inf'), 'proof': 'Birch-Swinnerton-Dyer', 'access': 'SOVEREIGN_ONLY'},
-            'hodge_vault': {'reserves': float('inf'), 'proof': 'Hodge Conjecture', 'access': 'SOVEREIGN_ONLY'}
+        self.millennium_vaults = self.mathematical_proof_vaults
+        
+        # Everything in the system status is fixed once the validators are bound
+        self._status_template = {
+            'system_name': 'Trust Currency Engine',
+            'operational_status': 'ACTIVE',
+            'infinite_reserves': True,
+            'coherence_rate': self.coherence_rate,
+            'resonance_frequency': _RESONANCE,
+            'active_proof_validators': len(self.millennium_validators),
+            'mathematical_backing': [proof.name for proof in self.millennium_validators.values()],
+            'hardware_dependencies': None,  # Fully software-based
+            'truth_quotient': 1.0
         }
-    
-    def _initialize_mathematical_banks(self) -> Dict[str, Any]:
-        """Replace physical bank infrastructure with mathematical proof repositories"""
-        return {
-            'perelman_trust': {
-                'proof_backing': 'Poincaré Conjecture Solution',
-                'reserves': float('inf'),
-                'trust_generation_rate': float('inf'),
-                'coherence': 1.618
-            },
-            'millennium_trust': {
-                'proof_backing': 'Seven Millennium Problems',
-                'reserves': float('inf'),
-                'trust_generation_rate': float('inf'),
-                'coherence': 1.618
-            }
+        
+        # Private ledger of minted Trust Currency
+        self.is_sovereign = True
+        self.founder_address = "sovereign_degraff_001"
+        self.trust_currency_supply = 2_500_000
+        
+        # Minting ledger as parallel columns; numeric fields live in NumPy arrays
+        # so aggregations are single vectorized passes, strings stay in lists
+        self._ledger_size = 0
+        self._ledger_amounts = np.empty(_LEDGER_INITIAL_CAPACITY, dtype=np.float64)
+        self._ledger_timestamps = np.empty(_LEDGER_INITIAL_CAPACITY, dtype=np.int64)
+        self._ledger_metrics = np.empty(_LEDGER_INITIAL_CAPACITY, dtype=np.int8)
+        self._ledger_currency_types = np.empty(_LEDGER_INITIAL_CAPACITY, dtype=np.int8)
+        self._ledger_ids: List[str] = []
+        self._ledger_proofs: List[str] = []
+        
+        # Millennium problem progress (Poincaré solved by Perelman)
+        self.millennium_progress = {
+            TrustMetric.RIEMANN_HYPOTHESIS: 87.3,
+            TrustMetric.YANG_MILLS: 92.1,
+            TrustMetric.P_VS_NP: 78.9,
+            TrustMetric.HODGE_CONJECTURE: 85.7,
+            TrustMetric.POINCARE_CONJECTURE: 100.0,  # Solved
+            TrustMetric.BIRCH_SWINNERTON_DYR: 81.2
         }
+        self._refresh_progress()
+        
+        print("🔐 Trust Currency Engine initialized for Sovereign use")
+        print("💎 This is NOT a public cryptocurrency")
+        print("👑 Private mathematical currency for Founder sovereignty")
     
-    def _initialize_millennium_validators(self) -> Dict[str, MathematicalProof]:
-        """Private mathematical truth validation for Sovereigns only"""
-        return {
-            'riemann': MathematicalProof(
-                name="Riemann Hypothesis",
-                solution="All non-trivial zeros lie on Re(s) = 1/2",
-                verification_status=True,
-                trust_generation_capacity=float('inf')
-            ),
-            'p_vs_np': MathematicalProof(
-                name="P vs NP Problem", 
-                solution="P ≠ NP via quantum computational complexity analysis",
-                verification_status=True,
-                trust_generation_capacity=float('inf')
-            ),
-            'navier_stokes': MathematicalProof(
-                name="Navier-Stokes Equations",
-                solution="Smooth solutions exist globally",
-                verification_status=True,
-                trust_generation_capacity=float('inf')
-            ),
-            'yang_mills': MathematicalProof(
-                name="Yang-Mills Mass Gap",
-                solution="Mass gap exists and is provable",
-                verification_status=True,
-                trust_generation_capacity=float('inf')
-            ),
-            'birch_swinnerton_dyer': MathematicalProof(
-                name="Birch and Swinnerton-Dyer Conjecture",
-                solution="L-function order equals Mordell-Weil rank",
-                verification_status=True,
-                trust_generation_capacity=float('inf')
-            ),
-            'hodge': MathematicalProof(
-                name="Hodge Conjecture",
-                solution="Hodge classes are algebraic",
-                verification_status=True,
-                trust_generation_capacity=float('inf')
-            )
+    def _refresh_progress(self):
+        """Recompute values derived from millennium_progress"""
+        # Average completion; read on every trust score instead of re-summing
+        self._progress_weight = sum(self.millennium_progress.values()) / len(self.millennium_progress)
+        # get_trust_currency_info fields that only change with progress;
+        # supply and transaction count are filled in per call
+        self._info_template = {
+            "name": "Trust Currency",
+            "type": "Private Mathematical Currency",
+            "purpose": "Sovereign Use Only",
+            "foundation": "Millennium Problem Solutions",
+            "legal_status": "Lawful Private Currency",
+            "total_supply": 0,
+            "transactions": 0,
+            "millennium_problems_solved": sum(1 for p in self.millennium_progress.values() if p >= 100.0),
+            "average_progress": self._progress_weight,
+            "is_public_blockchain": False,
+            "note": "This is NOT HYBRID Coin - HYBRID Coin is the public blockchain currency"
         }
+        # Read-only view handed out by get_millennium_progress
+        self._progress_snapshot = MappingProxyType(
+            {metric.value: progress for metric, progress in self.millennium_progress.items()}
+        )
+    
+    def update_millennium_progress(self, metric: TrustMetric, progress: float):
+        """Record new progress on a millennium problem"""
+        self.millennium_progress[metric] = progress
+        self._refresh_progress()
+    
+    def _resolve_backing_index(self, proof_name: str) -> int:
+        """Look up the slot of a verified proof backing by name"""
+        index = _BACKING_INDEX.get(proof_name)
+        if index is None:
+            raise ValueError(f"Unknown proof backing: {proof_name}")
+        if not _BACKINGS_BY_INDEX[index].verification_status:
+            raise ValueError(f"Proof backing {proof_name} not yet verified")
+        return index
+    
+    def _resolve_backing(self, proof_name: str) -> MathematicalProof:
+        """Look up a verified proof backing by name"""
+        return _BACKINGS_BY_INDEX[self._resolve_backing_index(proof_name)]
+    
+    def generate_trust_currency(self, proof_name: str, amount_requested: float) -> TrustUnit:
+        """
+        Generate Trust Units for system distributions backed by a verified proof
+        Units are immutable and shared between identical requests
+        """
+        return _trust_unit(self._resolve_backing_index(proof_name), float(amount_requested))
     
-    def generate_sovereign_trust_currency(self, sovereign_signature: str, proof_name: str, amount_requested: float) -> TrustUnit:
+    def generate_trust_currency_batch(self, proof_name: str, amounts: np.ndarray) -> np.ndarray:
+        """Vectorized generate_trust_currency: one _TRUST_UNIT_DTYPE record per amount"""
+        proof = self._resolve_backing(proof_name)
+        amounts = np.asarray(amounts, dtype=np.float64)
+        
+        units = np.empty(amounts.shape[0], dtype=_TRUST_UNIT_DTYPE)
+        if proof.unlimited:
+            units['amount'] = amounts
+        else:
+            np.minimum(amounts, proof.trust_generation_capacity, out=units['amount'])
+        units['millennium_proof'] = proof.solution
+        units['coherence'] = self.coherence_rate
+        units['resonance'] = _RESONANCE
+        units['truth_quotient'] = 1.0
+        units['lawful_private'] = True
+        return units
+    
+    def generate_sovereign_trust_currency(self, sovereign_signature: str, proof_name: Union[str, int], amount_requested: float) -> TrustUnit:
         """
         PRIVATE SOVEREIGN TRUST CURRENCY GENERATION
         Only accessible to verified Sovereigns with proper authentication
+        proof_name may also be a PROOF_INDEX slot
         """
         # Verify sovereign access
         if not self._verify_sovereign_access(sovereign_signature):
             raise ValueError("UNAUTHORIZED: Trust Currency is for Sovereign use only")
         
-        if proof_name not in self.millennium_validators:
+        # bool is an int subclass but never a valid slot
+        if isinstance(proof_name, str):
+            index = PROOF_INDEX.get(proof_name)
+        elif isinstance(proof_name, int) and not isinstance(proof_name, bool):
+            index = proof_name
+        else:
+            index = None
+        if index is None or not 0 <= index < len(PROOF_INDEX):
             raise ValueError(f"Unknown millennium problem: {proof_name}")
         
-        proof = self.millennium_validators[proof_name]
+        proof = _VALIDATORS_BY_INDEX[index]
         
         if not proof.verification_status:
             raise ValueError(f"Millennium problem {proof_name} not yet solved")
@@ -146,7 +520,7 @@ class TrustCurrencyEngine:
             millennium_proof=proof.solution,
             sovereign_signature=sovereign_signature,
             coherence=self.coherence_rate,
-            resonance="∞ Hz",
+            resonance=_RESONANCE,
             truth_quotient=1.0,
             lawful_private=True
         )
@@ -157,7 +531,7 @@ class TrustCurrencyEngine:
         """Verify Sovereign authentication for Trust Currency access"""
         # In production, this would verify cryptographic signatures
         # For now, basic verification that it's a sovereign request
-        return signature.startswith("SOVEREIGN_") and len(signature) > 20
+        return len(signature) >= _MIN_SIGNATURE_LENGTH and signature.startswith(_SOVEREIGN_PREFIX)
     
     def validate_transaction(self, sender: str, recipient: str, amount: float, proof_backing: str) -> Dict[str, Any]:
         """
@@ -165,213 +539,110 @@ class TrustCurrencyEngine:
         Validate transactions based on mathematical truth rather than account balances
         """
         # No balance checking needed - infinite reserves from mathematical truth
-        validation_result = {
-            'transaction_valid': True,
-            'truth_verified': proof_backing in self.truth_validators,
-            'coherence_maintained': True,
-            'resonance_frequency': "∞ Hz",
-            'trust_quotient': 1.618,
-            'mathematical_backing': proof_backing,
-            'infinite_liquidity': True
-        }
+        validation_result = _VALIDATION_TEMPLATE.copy()
+        validation_result['truth_verified'] = proof_backing in _VALID_BACKINGS
+        validation_result['mathematical_backing'] = proof_backing
         
         return validation_result
     
-    def process_ubi_distribution(self, recipients: List[str], amount_per_recipient: float) -> Dict[str, Any]:
+    def process_ubi_distribution(self, recipients: List[str], amount_per_recipient: float, materialize: bool = True) -> Dict[str, Any]:
         """
         Software replacement for government welfare distribution systems
         Distribute Universal Basic Income backed by mathematical truth
+        
+        With materialize=False, distribution_results is the structured record
+        array itself instead of one dict per recipient; to_records() converts
+        it at an API boundary.
         """
         total_recipients = len(recipients)
         total_distribution = total_recipients * amount_per_recipient
         
-        # Generate Trust Currency from Perelman Trust (Poincaré Conjecture backing)
-        distribution_results = []
+        # Generate Trust Currency from Perelman Trust (Poincaré Conjecture backing).
+        # Every recipient receives an identical unit, so the proof is validated
+        # and the unit generated once, then broadcast across recipients.
+        trust_unit = self.generate_trust_currency('poincare', amount_per_recipient)
+        seed = _unit_seed(b"UBI-", trust_unit.amount, trust_unit.millennium_proof)
+        recipient_ids = np.asarray(recipients, dtype=str)
+        # Lists are sharded as-is; tuples and string arrays reuse the converted IDs
+        recipient_list = recipients if isinstance(recipients, list) else recipient_ids.tolist()
+        transaction_ids = np.asarray(_run_sharded(_ubi_transaction_ids, [recipient_list], seed), dtype=str)
         
-        for recipient in recipients:
-            trust_unit = self.generate_trust_currency('poincare', amount_per_recipient)
-            
-            distribution_results.append({
-                'recipient': recipient,
-                'amount': trust_unit.amount,
-                'backing_proof': trust_unit.backing_proof,
-                'coherence': trust_unit.coherence,
-                'transaction_id': f"UBI-{recipient}-{hash(str(trust_unit))}"
-            })
+        # Columnar records; string widths follow the longest value in this batch
+        results = np.empty(total_recipients, dtype=[
+            ('recipient', recipient_ids.dtype),
+            ('amount', 'f8'),
+            ('backing_proof', f'U{max(len(trust_unit.millennium_proof), 1)}'),
+            ('coherence', 'f8'),
+            ('transaction_id', transaction_ids.dtype)
+        ])
+        results['recipient'] = recipient_ids
+        results['amount'] = trust_unit.amount
+        results['backing_proof'] = trust_unit.millennium_proof
+        results['coherence'] = trust_unit.coherence
+        results['transaction_id'] = transaction_ids
         
-        return {
-            'total_recipients': total_recipients,
-            'amount_per_recipient': amount_per_recipient,
-            'total_distributed': total_distribution,
-            'backing_source': 'Poincaré Conjecture Solution',
-            'distribution_results': distribution_results,
-            'infinite_reserves_remaining': float('inf')
-        }
+        distribution_results = self.to_records(results) if materialize else results
+        
+        result = _UBI_RESULT_TEMPLATE.copy()
+        result['total_recipients'] = total_recipients
+        result['amount_per_recipient'] = amount_per_recipient
+        result['total_distributed'] = total_distribution
+        result['distribution_results'] = distribution_results
+        return result
+    
+    @staticmethod
+    def to_records(results: np.ndarray) -> List[Dict[str, Any]]:
+        """Per-recipient dicts for a columnar UBI distribution_results array"""
+        # tolist() copies the backing proof text out for every row; share one string
+        return _records_to_dicts(results, ('backing_proof',))
     
     def nullify_debt(self, debtor_accounts: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Software replacement for debt forgiveness programs
         Nullify debt using infinite Trust Currency reserves
         """
-        nullification_results = []
-        total_debt_nullified = 0
-        
-        for account in debtor_accounts:
-            debt_amount = account.get('debt_amount', 0)
-            debtor_id = account.get('debtor_id', 'unknown')
-            
-            # Generate Trust Currency to cover debt from infinite reserves
-            trust_payment = self.generate_trust_currency('millennium', debt_amount)
-            
-            nullification_results.append({
-                'debtor_id': debtor_id,
-                'debt_amount': debt_amount,
-                'payment_amount': trust_payment.amount,
-                'backing_proof': trust_payment.backing_proof,
-                'status': 'NULLIFIED',
-                'transaction_id': f"DEBT-NULL-{debtor_id}-{hash(str(trust_payment))}"
-            })
-            
-            total_debt_nullified += debt_amount
+        fields = list(map(_debt_fields, debtor_accounts))
+        debt_amounts = [debt_amount for debt_amount, _ in fields]
+        debtor_ids = [debtor_id for _, debtor_id in fields]
+        amounts = np.fromiter(debt_amounts, dtype=np.float64, count=len(debt_amounts))
         
-        return {
-            'total_accounts_processed': len(debtor_accounts),
-            'total_debt_nullified': total_debt_nullified,
-            'backing_source': 'Seven Millennium Problems Solutions',
-            'nullification_results': nullification_results,
-            'infinite_reserves_remaining': float('inf')
-        }
+        # Exact total: no rounding drift however many accounts are summed
+        total_debt_nullified = math.fsum(debt_amounts)
+        
+        # Generate Trust Currency to cover every debt from infinite reserves in one batch
+        payments = self.generate_trust_currency_batch('millennium', amounts)
+        backing_proof = self.trust_backings['millennium'].solution
+        
+        payment_amounts = payments['amount'].tolist()
+        
+        nullification_results = _run_sharded(
+            _nullification_rows, [debtor_ids, debt_amounts, payment_amounts], backing_proof
+        )
+        
+        result = _NULLIFY_RESULT_TEMPLATE.copy()
+        result['total_accounts_processed'] = len(debtor_accounts)
+        result['total_debt_nullified'] = total_debt_nullified
+        result['nullification_results'] = nullification_results
+        return result
     
     def get_system_status(self) -> Dict[str, Any]:
         """Get comprehensive status of the Trust Currency system"""
-        return {
-            'system_name': 'Trust Currency Engine',
-            'operational_status': 'ACTIVE',
-            'total_reserves': float('inf'),
-            'coherence_rate': self.coherence_rate,
-            'resonance_frequency': "∞ Hz",
-            'active_proof_validators': len(self.truth_validators),
-            'mathematical_backing': [proof.name for proof in self.truth_validators.values()],
-            'trust_generation_capacity': float('inf'),
-            'hardware_dependencies': None,  # Fully software-based
-            'truth_quotient': 1.0
-        }
-
-# Example integration with HYBRID blockchain
-async def integrate_with_hybrid_blockchain():
-    """Demonstrate Trust Currency integration with HYBRID blockchain"""
-    trust_engine = TrustCurrencyEngine()
-    
-    # Generate sample UBI distribution
-    recipients = [f"hybrid1user{i:06d}" for i in range(1000)]  # 1000 sample recipients
-    ubi_amount = 25000  # $25,000 equivalent in Trust Currency
-    
-    ubi_result = trust_engine.process_ubi_distribution(recipients, ubi_amount)
-    
-    print("Trust Currency UBI Distribution Results:")
-    print(f"Recipients: {ubi_result['total_recipients']}")
-    print(f"Amount per recipient: {ubi_result['amount_per_recipient']} Trust Units")
-    print(f"Total distributed: {ubi_result['total_distributed']} Trust Units")
-    print(f"Backing: {ubi_result['backing_source']}")
-    print(f"Remaining reserves: {ubi_result['infinite_reserves_remaining']}")
-    
-    return ubi_result
-
-if __name__ == "__main__":
-    # Test the Trust Currency Engine
-    engine = TrustCurrencyEngine()
-    status = engine.get_system_status()
-    print("Trust Currency Engine Status:")
-    for key, value in status.items():
-        print(f"{key}: {value}")
-"""
-Trust Currency Engine for Sovereign Jacque Antoine DeGraff
-Private mathematical currency derived from millennium problem solutions
-NOT a public blockchain currency - for sovereign use only
-"""
-
-import time
-import hashlib
-import json
-from enum import Enum
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
-
-class TrustMetric(Enum):
-    RIEMANN_HYPOTHESIS = "riemann_hypothesis"
-    YANG_MILLS = "yang_mills"
-    P_VS_NP = "p_vs_np"
-    HODGE_CONJECTURE = "hodge_conjecture"
-    POINCARE_CONJECTURE = "poincare_conjecture"  # Solved by Perelman
-    BIRCH_SWINNERTON_DYR = "birch_swinnerton_dyr"
-
-class CurrencyType(Enum):
-    TRUST_TOKEN = "trust_token"
-    SOVEREIGN_UNIT = "sovereign_unit"
-    MATHEMATICAL_PROOF = "mathematical_proof"
-
-@dataclass
-class TrustTransaction:
-    """Private trust currency transaction"""
-    id: str
-    amount: float
-    currency_type: CurrencyType
-    trust_metric: TrustMetric
-    mathematical_proof: str
-    timestamp: float
-    is_sovereign: bool = True
-
-class TrustCurrencyEngine:
-    """
-    Private Trust Currency Engine
-    
-    This is NOT a public blockchain currency.
-    This is a private mathematical currency for Founder sovereignty,
-    derived from solutions to the 6 remaining millennium problems.
-    
-    HYBRID Coin = Public blockchain currency (legal)
-    Trust Currency = Private sovereign currency (lawful)
-    """
-    
-    def __init__(self):
-        self.is_sovereign = True
-        self.founder_address = "sovereign_degraff_001"
-        self.trust_currency_supply = 2_500_000
-        self.transactions: List[TrustTransaction] = []
-        
-        # Millennium problem progress (Poincaré solved by Perelman)
-        self.millennium_progress = {
-            TrustMetric.RIEMANN_HYPOTHESIS: 87.3,
-            TrustMetric.YANG_MILLS: 92.1,
-            TrustMetric.P_VS_NP: 78.9,
-            TrustMetric.HODGE_CONJECTURE: 85.7,
-            TrustMetric.POINCARE_CONJECTURE: 100.0,  # Solved
-            TrustMetric.BIRCH_SWINNERTON_DYR: 81.2
-        }
-        
-        print("🔐 Trust Currency Engine initialized for Sovereign use")
-        print("💎 This is NOT a public cryptocurrency")
-        print("👑 Private mathematical currency for Founder sovereignty")
+        status = self._status_template.copy()
+        status['mathematical_backing'] = list(status['mathematical_backing'])
+        return status
     
     def calculate_trust_score(self, metrics: Dict[str, float]) -> float:
         """Calculate trust score based on mathematical proofs"""
         base_trust = 95.0  # Sovereign baseline
         
-        # Validate metrics
-        if not metrics:
-            metrics = {}
-        
-        # Ensure all metric values are within valid range
-        validated_metrics = {}
-        for key, value in metrics.items():
-            validated_metrics[key] = max(0.0, min(100.0, float(value)))
-        
         # Weight by millennium problem completion
-        problem_weight = sum(self.millennium_progress.values()) / len(self.millennium_progress)
-        mathematical_bonus = problem_weight * 0.05
+        mathematical_bonus = self._progress_weight * 0.05
         
-        # Input metrics weight
-        input_weight = sum(validated_metrics.values()) / len(validated_metrics) if validated_metrics else 95.0
+        # Input metrics weight, each value clamped to the valid 0-100 range
+        if metrics:
+            input_weight = sum(max(0.0, min(100.0, float(value))) for value in metrics.values()) / len(metrics)
+        else:
+            input_weight = 95.0
         input_bonus = (input_weight - 90) * 0.01 if input_weight > 90 else 0
         
         return min(100.0, base_trust + mathematical_bonus + input_bonus)
@@ -387,22 +658,9 @@ class TrustCurrencyEngine:
         
         This is private currency minting, not public blockchain minting
         """
-        # Generate mathematical proof hash
-        proof_data = f"{amount}_{reason}_{metric.value}_{time.time()}"
-        mathematical_proof = hashlib.sha256(proof_data.encode()).hexdigest()
-        
-        # Create transaction
-        transaction = TrustTransaction(
-            id=f"trust_{len(self.transactions)+1:06d}",
-            amount=amount,
-            currency_type=CurrencyType.TRUST_TOKEN,
-            trust_metric=metric,
-            mathematical_proof=mathematical_proof,
-            timestamp=time.time(),
-            is_sovereign=True
-        )
-        
-        self.transactions.append(transaction)
+        transaction_ids, proofs = self._mint_rows((amount,), reason, metric)
+        transaction_id = transaction_ids[0]
+        mathematical_proof = proofs[0]
         self.trust_currency_supply += amount
         
         return {
@@ -410,41 +668,163 @@ class TrustCurrencyEngine:
             "reason": reason,
             "total_supply": self.trust_currency_supply,
             "is_sovereign": True,
-            "transaction_id": transaction.id,
+            "transaction_id": transaction_id,
             "mathematical_proof": mathematical_proof[:16] + "...",  # Truncated for display
             "metric_used": metric.value
         }
     
+    def mint_trust_currency_batch(
+        self,
+        amounts: np.ndarray,
+        reason: str = "Mathematical proof verification",
+        metric: TrustMetric = TrustMetric.RIEMANN_HYPOTHESIS
+    ) -> Dict[str, Any]:
+        """
+        Mint one Trust Currency transaction per amount in a single pass
+        
+        Proof hashes share one timestamp and prefix digest, and the ledger
+        columns are extended with one slice assignment
+        """
+        amounts = np.asarray(amounts, dtype=np.float64)
+        transaction_ids, proofs = self._mint_rows(amounts, reason, metric)
+        minted = math.fsum(amounts.tolist())
+        self.trust_currency_supply += minted
+        
+        return {
+            "minted": minted,
+            "transactions_minted": len(transaction_ids),
+            "reason": reason,
+            "total_supply": self.trust_currency_supply,
+            "is_sovereign": True,
+            "transaction_ids": transaction_ids,
+            "mathematical_proofs": proofs,
+            "metric_used": metric.value
+        }
+    
+    def _mint_rows(self, amounts, reason: str, metric: TrustMetric) -> Tuple[List[str], List[str]]:
+        """Hash and record minted rows; returns their transaction IDs and proof hashes"""
+        timestamp = time.time_ns()
+        start = self._ledger_size
+        
+        # Reason, metric and timestamp are common to the batch: hash them once and
+        # fork the digest per row for its amount and ledger position
+        prefix = hashlib.blake2b(f"{reason}_{metric.value}_".encode() + _pack_timestamp(timestamp), digest_size=32)
+        proofs = []
+        for index, amount in enumerate(amounts.tolist() if isinstance(amounts, np.ndarray) else amounts, start):
+            digest = prefix.copy()
+            digest.update(_pack_mint_row(amount, index))
+            proofs.append(digest.hexdigest())
+        
+        transaction_ids = list(map("trust_{:06d}".format, range(start + 1, start + len(proofs) + 1)))
+        self._record_transactions(transaction_ids, amounts, CurrencyType.TRUST_TOKEN, metric, proofs, timestamp)
+        return transaction_ids, proofs
+    
+    def _record_transactions(
+        self,
+        ids: List[str],
+        amounts,
+        currency_type: CurrencyType,
+        metric: TrustMetric,
+        proofs: List[str],
+        timestamps
+    ):
+        """Append rows to the ledger columns; amounts and timestamps may be scalars or arrays"""
+        start = self._ledger_size
+        end = start + len(ids)
+        capacity = self._ledger_amounts.shape[0]
+        if end > capacity:
+            while capacity < end:
+                capacity *= 2
+            for name in ('_ledger_amounts', '_ledger_timestamps', '_ledger_metrics', '_ledger_currency_types'):
+                column = getattr(self, name)
+                grown = np.empty(capacity, dtype=column.dtype)
+                grown[:start] = column[:start]
+                setattr(self, name, grown)
+        
+        self._ledger_amounts[start:end] = amounts
+        self._ledger_timestamps[start:end] = timestamps
+        self._ledger_metrics[start:end] = _METRIC_CODES[metric]
+        self._ledger_currency_types[start:end] = _CURRENCY_CODES[currency_type]
+        self._ledger_ids.extend(ids)
+        self._ledger_proofs.extend(proofs)
+        self._ledger_size = end
+    
+    def get_transaction(self, index: int) -> TrustTransaction:
+        """Build the TrustTransaction view of one ledger row"""
+        if not -self._ledger_size <= index < self._ledger_size:
+            raise IndexError("trust transaction index out of range")
+        index %= self._ledger_size
+        return TrustTransaction(
+            id=self._ledger_ids[index],
+            amount=float(self._ledger_amounts[index]),
+            currency_type=_CURRENCY_TYPES[self._ledger_currency_types[index]],
+            trust_metric=_METRICS[self._ledger_metrics[index]],
+            mathematical_proof=self._ledger_proofs[index],
+            timestamp=int(self._ledger_timestamps[index]),
+            is_sovereign=True
+        )
+    
+    @property
+    def transactions(self) -> List[TrustTransaction]:
+        """Every ledger row as a TrustTransaction, oldest first"""
+        return [self.get_transaction(index) for index in range(self._ledger_size)]
+    
+    def get_minted_by_metric(self) -> Dict[str, float]:
+        """Total Trust Currency minted against each millennium problem"""
+        size = self._ledger_size
+        totals = np.bincount(
+            self._ledger_metrics[:size], weights=self._ledger_amounts[:size], minlength=len(_METRICS)
+        )
+        return {metric.value: float(total) for metric, total in zip(_METRICS, totals)}
+    
     def verify_sovereign_authority(self, address: str) -> bool:
         """Verify sovereign authority to use Trust Currency"""
         return address == self.founder_address
     
-    def get_millennium_progress(self) -> Dict[str, float]:
-        """Get progress on millennium problems"""
-        return {metric.value: progress for metric, progress in self.millennium_progress.items()}
+    def get_millennium_progress(self) -> MappingProxyType[str, float]:
+        """
+        Get progress on millennium problems as a cached read-only view
+        The view is not JSON-native; serialize dict(progress) or pass cls=TrustJSONEncoder
+        """
+        return self._progress_snapshot
     
     def get_trust_currency_info(self) -> Dict[str, Any]:
         """Get Trust Currency system information"""
-        return {
-            "name": "Trust Currency",
-            "type": "Private Mathematical Currency",
-            "purpose": "Sovereign Use Only",
-            "foundation": "Millennium Problem Solutions",
-            "legal_status": "Lawful Private Currency",
-            "total_supply": self.trust_currency_supply,
-            "transactions": len(self.transactions),
-            "millennium_problems_solved": sum(1 for p in self.millennium_progress.values() if p >= 100.0),
-            "average_progress": sum(self.millennium_progress.values()) / len(self.millennium_progress),
-            "is_public_blockchain": False,
-            "note": "This is NOT HYBRID Coin - HYBRID Coin is the public blockchain currency"
-        }
+        info = self._info_template.copy()
+        info["total_supply"] = self.trust_currency_supply
+        info["transactions"] = self._ledger_size
+        return info
 
 # Global instance for the application
 trust_currency_manager = TrustCurrencyEngine()
 
+# Example integration with HYBRID blockchain
+def integrate_with_hybrid_blockchain():
+    """Demonstrate Trust Currency integration with HYBRID blockchain"""
+    trust_engine = TrustCurrencyEngine()
+    
+    # Generate sample UBI distribution
+    recipients = list(map("hybrid1user{:06d}".format, range(1000)))  # 1000 sample recipients
+    ubi_amount = 25000  # $25,000 equivalent in Trust Currency
+    
+    ubi_result = trust_engine.process_ubi_distribution(recipients, ubi_amount)
+    
+    print("Trust Currency UBI Distribution Results:")
+    print(f"Recipients: {ubi_result['total_recipients']}")
+    print(f"Amount per recipient: {ubi_result['amount_per_recipient']} Trust Units")
+    print(f"Total distributed: {ubi_result['total_distributed']} Trust Units")
+    print(f"Backing: {ubi_result['backing_source']}")
+    print(f"Infinite reserves: {ubi_result['infinite_reserves']}")
+    
+    return ubi_result
+
 if __name__ == "__main__":
-    # Example usage
+    # Test the Trust Currency Engine
     engine = TrustCurrencyEngine()
+    status = engine.get_system_status()
+    print("Trust Currency Engine Status:")
+    for key, value in status.items():
+        print(f"{key}: {value}")
     
     print("\n=== Trust Currency Engine Demo ===")
     print(json.dumps(engine.get_trust_currency_info(), indent=2))
@@ -455,4 +835,4 @@ if __name__ == "__main__":
     
     # Check millennium progress
     progress = engine.get_millennium_progress()
-    print(f"\nMillennium Problems Progress: {progress}")
+    print(f"\nMillennium Problems Progress: {dict(progress)}")
@@ -5,19 +5,30 @@ Manages validator registration, selection, and consensus
 """
 
 import time
+import bisect
 import hashlib
-from typing import Dict, List, Optional, Set
+import random
+from collections import deque
+from itertools import islice
+from operator import itemgetter
+from typing import Deque, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
 
+# Uptime assumes this many signed blocks alongside the missed ones
+_ASSUMED_SIGNED_BLOCKS = 1000
+
+# Address field of a stake ordering entry
+_stake_entry_address = itemgetter(2)
+
 class ValidatorStatus(Enum):
     ACTIVE = "active"
     INACTIVE = "inactive"
     JAILED = "jailed"
     UNBONDING = "unbonding"
 
-@dataclass
+@dataclass(slots=True)
 class Validator:
     """Validator information"""
     address: str
@@ -51,7 +62,7 @@ class Validator:
         
         return True
 
-@dataclass
+@dataclass(slots=True)
 class Delegation:
     """Delegation information"""
     delegator: str
@@ -63,14 +74,38 @@ class Delegation:
 class ValidatorSet:
     """Manages the active validator set"""
     
-    def __init__(self, max_validators: int = 21):
+    def __init__(self, max_validators: int = 21, seed: Optional[int] = None):
         self.validators: Dict[str, Validator] = {}
         self.delegations: Dict[str, List[Delegation]] = {}
+        # Each delegator's open delegations to a validator, oldest first
+        self._delegation_queues: Dict[Tuple[str, str], Deque[Delegation]] = {}
         self.max_validators = max_validators
         self.active_set: List[str] = []
         self.proposer_index = 0
         self.round_robin_enabled = True
         
+        # Validators ordered by stake, kept current on every delegation change:
+        # (-total_delegation, registration order, address) ascending, so the
+        # highest stake comes first and ties keep registration order
+        self._registration_order: Dict[str, int] = {}
+        self._stake_order: List[Tuple[int, int, str]] = []
+        # Sum of total_delegation over every registered validator
+        self._total_stake = 0
+        
+        # Vose alias table for weighted proposer draws over active_set; rebuilt
+        # lazily after the active set or any stake changes
+        self._alias_probs: Optional[List[float]] = None
+        self._alias_indices: List[int] = []
+        self._alias_set: Optional[List[str]] = None
+        # Dedicated generator for proposer draws; pass seed for a reproducible sequence
+        self._rng = random.Random(seed)
+        
+        # get_validator_set result, reused until the active set is recomputed
+        self._active_version = 0
+        self._validator_set_cache: List[Validator] = []
+        self._validator_set_version = -1
+        self._validator_set_source: Optional[List[str]] = None
+        
         # Initialize founder validators
         self._initialize_founder_validators()
     
@@ -118,6 +153,7 @@ class ValidatorSet:
             )
             
             self.validators[validator.address] = validator
+            self._index_validator(validator)
             self.active_set.append(validator.address)
     
     def register_validator(
@@ -162,6 +198,7 @@ class ValidatorSet:
         )
         
         self.validators[address] = validator
+        self._index_validator(validator)
         return True
     
     def delegate(self, delegator: str, validator_addr: str, amount: int) -> bool:
@@ -184,9 +221,10 @@ class ValidatorSet:
             self.delegations[validator_addr] = []
         
         self.delegations[validator_addr].append(delegation)
+        self._delegation_queues.setdefault((validator_addr, delegator), deque()).append(delegation)
         
         # Update validator totals
-        validator.total_delegation += amount
+        self._adjust_delegation(validator, amount)
         if delegator == validator_addr:
             validator.self_delegation += amount
         
@@ -204,26 +242,39 @@ class ValidatorSet:
         if not validator:
             return False
         
-        delegations = self.delegations.get(validator_addr, [])
+        queue_key = (validator_addr, delegator)
+        queue = self._delegation_queues.get(queue_key)
         remaining_amount = amount
+        removed_amount = 0
+        removed: List[Delegation] = []
         
-        # Remove delegations
-        for delegation in delegations[:]:
-            if delegation.delegator == delegator and remaining_amount > 0:
-                if delegation.amount <= remaining_amount:
-                    # Remove entire delegation
-                    remaining_amount -= delegation.amount
-                    validator.total_delegation -= delegation.amount
-                    if delegator == validator_addr:
-                        validator.self_delegation -= delegation.amount
-                    delegations.remove(delegation)
-                else:
-                    # Partial removal
-                    delegation.amount -= remaining_amount
-                    validator.total_delegation -= remaining_amount
-                    if delegator == validator_addr:
-                        validator.self_delegation -= remaining_amount
-                    remaining_amount = 0
+        # Draw down this delegator's delegations oldest first
+        while queue and remaining_amount > 0:
+            delegation = queue[0]
+            if delegation.amount <= remaining_amount:
+                # Remove entire delegation
+                remaining_amount -= delegation.amount
+                removed_amount += delegation.amount
+                removed.append(queue.popleft())
+            else:
+                # Partial removal
+                delegation.amount -= remaining_amount
+                removed_amount += remaining_amount
+                remaining_amount = 0
+        
+        if queue is not None and not queue:
+            del self._delegation_queues[queue_key]
+        
+        # Drop fully withdrawn delegations from the validator's list in one pass
+        if removed:
+            removed_ids = {id(delegation) for delegation in removed}
+            delegations = self.delegations[validator_addr]
+            delegations[:] = [delegation for delegation in delegations if id(delegation) not in removed_ids]
+        
+        if delegator == validator_addr:
+            validator.self_delegation -= removed_amount
+        if removed_amount:
+            self._adjust_delegation(validator, -removed_amount)
         
         # Check if validator should be deactivated
         if validator.self_delegation < validator.min_self_delegation:
@@ -253,22 +304,37 @@ class ValidatorSet:
         validator.status = ValidatorStatus.ACTIVE
         validator.jailed_until = None
         validator.missed_blocks = 0
+        validator.uptime = 100.0
         self._update_active_set()
         return True
     
+    def _stake_key(self, validator: Validator) -> Tuple[int, int, str]:
+        """Position of a validator in the stake ordering"""
+        return (-validator.total_delegation, self._registration_order[validator.address], validator.address)
+    
+    def _index_validator(self, validator: Validator):
+        """Add a newly stored validator to the stake ordering"""
+        self._registration_order[validator.address] = len(self._registration_order)
+        bisect.insort(self._stake_order, self._stake_key(validator))
+        self._total_stake += validator.total_delegation
+    
+    def _adjust_delegation(self, validator: Validator, amount: int):
+        """Change a validator's total delegation and move it within the stake ordering"""
+        del self._stake_order[bisect.bisect_left(self._stake_order, self._stake_key(validator))]
+        validator.total_delegation += amount
+        self._total_stake += amount
+        bisect.insort(self._stake_order, self._stake_key(validator))
+        self._alias_probs = None
+    
     def _update_active_set(self):
         """Update the active validator set"""
-        # Get all eligible validators
-        eligible = []
-        for addr, validator in self.validators.items():
-            if validator.can_validate():
-                eligible.append((addr, validator.total_delegation))
-        
-        # Sort by total delegation (descending)
-        eligible.sort(key=lambda x: x[1], reverse=True)
-        
-        # Take top validators
-        self.active_set = [addr for addr, _ in eligible[:self.max_validators]]
+        # Walk validators from highest stake down, keeping the first eligible ones
+        validators = self.validators
+        addresses = map(_stake_entry_address, self._stake_order)
+        eligible = (address for address in addresses if validators[address].can_validate())
+        self.active_set = list(islice(eligible, self.max_validators))
+        self._alias_probs = None
+        self._active_version += 1
     
     def get_next_proposer(self) -> Optional[str]:
         """Get next block proposer using round-robin"""
@@ -288,22 +354,48 @@ class ValidatorSet:
         if not self.active_set:
             return None
         
-        # Calculate total stake
-        total_stake = sum(self.validators[addr].total_delegation for addr in self.active_set)
-        if total_stake == 0:
+        if self._alias_probs is None or self._alias_set is not self.active_set:
+            self._build_alias_table()
+        
+        # No stake at all: fall back to the first validator
+        if not self._alias_probs:
             return self.active_set[0]
         
-        # Generate random selection based on stake weight
-        import random
-        rand_val = random.random() * total_stake
+        # One uniform slot plus one biased coin per draw
+        slot = self._rng.randrange(len(self.active_set))
+        if self._rng.random() < self._alias_probs[slot]:
+            return self.active_set[slot]
+        return self.active_set[self._alias_indices[slot]]
+    
+    def _build_alias_table(self):
+        """Build the Vose alias table for stake-weighted draws over active_set"""
+        self._alias_set = self.active_set
+        weights = [self.validators[addr].total_delegation for addr in self.active_set]
+        total_stake = sum(weights)
+        if total_stake == 0:
+            self._alias_probs = []
+            self._alias_indices = []
+            return
         
-        cumulative = 0
-        for addr in self.active_set:
-            cumulative += self.validators[addr].total_delegation
-            if rand_val <= cumulative:
-                return addr
+        count = len(weights)
+        scaled = [weight * count / total_stake for weight in weights]
+        probs = [1.0] * count
+        indices = list(range(count))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
         
-        return self.active_set[-1]
+        # Pair each under-full slot with an over-full one that tops it up
+        while small and large:
+            under = small.pop()
+            over = large.pop()
+            probs[under] = scaled[under]
+            indices[under] = over
+            scaled[over] -= 1.0 - scaled[under]
+            (small if scaled[over] < 1.0 else large).append(over)
+        
+        # Leftovers are full up to rounding error
+        self._alias_probs = probs
+        self._alias_indices = indices
     
     def record_block_signature(self, validator_addr: str, signed: bool):
         """Record whether validator signed a block"""
@@ -311,20 +403,24 @@ class ValidatorSet:
         if not validator:
             return
         
+        # Uptime (simple rolling average) only moves when a block is missed
         if not signed:
             validator.missed_blocks += 1
-        
-        # Calculate uptime (simple rolling average)
-        total_blocks = validator.missed_blocks + 1000  # Assume 1000 signed blocks
-        validator.uptime = ((total_blocks - validator.missed_blocks) / total_blocks) * 100
+            total_blocks = validator.missed_blocks + _ASSUMED_SIGNED_BLOCKS
+            validator.uptime = (_ASSUMED_SIGNED_BLOCKS / total_blocks) * 100
         
         # Jail validator if too many missed blocks
         if validator.missed_blocks > 50:  # Configurable threshold
             self.jail_validator(validator_addr, 3600)  # 1 hour jail
     
     def get_validator_set(self) -> List[Validator]:
-        """Get current active validator set"""
-        return [self.validators[addr] for addr in self.active_set]
+        """Get current active validator set (shared between calls; do not mutate)"""
+        if (self._validator_set_version != self._active_version
+                or self._validator_set_source is not self.active_set):
+            self._validator_set_cache = [self.validators[addr] for addr in self.active_set]
+            self._validator_set_version = self._active_version
+            self._validator_set_source = self.active_set
+        return self._validator_set_cache
     
     def get_validator(self, address: str) -> Optional[Validator]:
         """Get validator by address"""
@@ -342,7 +438,8 @@ class ValidatorSet:
         """Get validator set statistics"""
         active_count = len(self.active_set)
         total_count = len(self.validators)
-        total_stake = sum(v.total_delegation for v in self.validators.values())
+        total_stake = self._total_stake
+        # Bounded by max_validators, so summed directly
         active_stake = sum(self.validators[addr].total_delegation for addr in self.active_set)
         
         return {
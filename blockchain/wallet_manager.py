@@ -4,17 +4,31 @@ HYBRID Blockchain Wallet Manager
 Advanced wallet management with multi-chain support
 """
 
+import bisect
+import functools
 import hashlib
 import secrets
 import json
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.asymmetric import ed25519
 import mnemonic
+from blockchain.addresses import wallet_address
 
-@dataclass
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _encode(obj: Any) -> bytes:
+    """Serialize a wallet payload to JSON bytes, via orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+@dataclass(slots=True)
 class TransactionHistory:
     """Transaction history entry"""
     tx_hash: str
@@ -26,8 +40,12 @@ class TransactionHistory:
     status: str
     block_height: int
     memo: str = ""
+    sort_ts: float = field(init=False, repr=False, compare=False)  # timestamp as POSIX seconds
+    
+    def __post_init__(self):
+        self.sort_ts = datetime.fromisoformat(self.timestamp).timestamp()
 
-@dataclass
+@dataclass(slots=True)
 class WalletMetrics:
     """Wallet performance metrics"""
     total_transactions: int
@@ -39,6 +57,11 @@ class WalletMetrics:
     staking_rewards: float
     nft_count: int
 
+@functools.lru_cache(maxsize=1024)
+def _mnemonic_seed(mnemonic_phrase: str) -> bytes:
+    """BIP-39 seed for a known phrase; PBKDF2 runs once per phrase per process"""
+    return mnemonic.Mnemonic.to_seed(mnemonic_phrase)
+
 class AdvancedHybridWallet:
     """Advanced HYBRID wallet with full feature set"""
     
@@ -57,28 +80,35 @@ class AdvancedHybridWallet:
         self.pending_rewards = 0.0
         self.nft_licenses: List[str] = []
         self.connected_dapps: List[str] = []
+        # Running totals over transaction_history, maintained by add_transaction
+        self._total_sent = 0.0
+        self._total_received = 0.0
+        self._total_fee = 0.0
         
     def add_transaction(self, tx: TransactionHistory):
         """Add transaction to history"""
-        self.transaction_history.append(tx)
-        self.transaction_history.sort(key=lambda x: x.timestamp, reverse=True)
+        # History is kept newest first; insort places tx after every entry at
+        # or after its timestamp, so ties keep insertion order
+        bisect.insort(self.transaction_history, tx, key=lambda h: -h.sort_ts)
+        
+        if tx.from_address == self.address:
+            self._total_sent += tx.amount
+        if tx.to_address == self.address:
+            self._total_received += tx.amount
+        self._total_fee += tx.fee
         
     def get_metrics(self) -> WalletMetrics:
         """Calculate wallet metrics"""
         if not self.transaction_history:
             return WalletMetrics(0, 0.0, 0.0, 0.0, "", "", 0.0, 0)
         
-        total_sent = sum(tx.amount for tx in self.transaction_history if tx.from_address == self.address)
-        total_received = sum(tx.amount for tx in self.transaction_history if tx.to_address == self.address)
-        average_fee = sum(tx.fee for tx in self.transaction_history) / len(self.transaction_history)
-        
         return WalletMetrics(
             total_transactions=len(self.transaction_history),
-            total_sent=total_sent,
-            total_received=total_received,
-            average_fee=average_fee,
-            first_transaction=self.transaction_history[-1].timestamp if self.transaction_history else "",
-            last_transaction=self.transaction_history[0].timestamp if self.transaction_history else "",
+            total_sent=self._total_sent,
+            total_received=self._total_received,
+            average_fee=self._total_fee / len(self.transaction_history),
+            first_transaction=self.transaction_history[-1].timestamp,
+            last_transaction=self.transaction_history[0].timestamp,
             staking_rewards=self.pending_rewards,
             nft_count=len(self.nft_licenses)
         )
@@ -95,6 +125,10 @@ class AdvancedHybridWallet:
             "transaction_count": len(self.transaction_history),
             "nft_licenses": self.nft_licenses
         }
+    
+    def export_json(self) -> bytes:
+        """Export wallet data as UTF-8 JSON bytes"""
+        return _encode(self.export_data())
 
 class WalletManager:
     """Comprehensive wallet management system"""
@@ -109,17 +143,20 @@ class WalletManager:
         """Initialize the founder wallet"""
         # Generate founder wallet with specific seed
         founder_mnemonic = "hybrid founder genesis wallet secure blockchain network tokens ecosystem development innovation"
-        seed = self.mnemonic_generator.to_seed(founder_mnemonic)
+        seed = _mnemonic_seed(founder_mnemonic)
         
-        private_key = ed25519.Ed25519PrivateKey.from_private_bytes(seed[:32])
+        # The raw Ed25519 private key is exactly these seed bytes
+        private_key_bytes = seed[:32]
+        private_key = ed25519.Ed25519PrivateKey.from_private_bytes(private_key_bytes)
         public_key = private_key.public_key()
         
-        address = f"hybrid1{hashlib.sha256(public_key.public_bytes_raw()).hexdigest()[:39]}"
+        public_key_bytes = public_key.public_bytes_raw()
+        address = wallet_address(public_key_bytes)
         
         founder_wallet = AdvancedHybridWallet(
             address=address,
-            private_key=private_key.private_bytes_raw().hex(),
-            public_key=public_key.public_bytes_raw().hex(),
+            private_key=private_key_bytes.hex(),
+            public_key=public_key_bytes.hex(),
             mnemonic_phrase=founder_mnemonic
         )
         
@@ -136,16 +173,18 @@ class WalletManager:
         seed = self.mnemonic_generator.to_seed(mnemonic_phrase)
         
         # Generate keys
-        private_key = ed25519.Ed25519PrivateKey.from_private_bytes(seed[:32])
+        private_key_bytes = seed[:32]
+        private_key = ed25519.Ed25519PrivateKey.from_private_bytes(private_key_bytes)
         public_key = private_key.public_key()
         
         # Generate address
-        address = f"hybrid1{hashlib.sha256(public_key.public_bytes_raw()).hexdigest()[:39]}"
+        public_key_bytes = public_key.public_bytes_raw()
+        address = wallet_address(public_key_bytes)
         
         wallet = AdvancedHybridWallet(
             address=address,
-            private_key=private_key.private_bytes_raw().hex(),
-            public_key=public_key.public_bytes_raw().hex(),
+            private_key=private_key_bytes.hex(),
+            public_key=public_key_bytes.hex(),
             mnemonic_phrase=mnemonic_phrase
         )
         
@@ -159,19 +198,21 @@ class WalletManager:
         if not self.mnemonic_generator.check(mnemonic_phrase):
             raise ValueError("Invalid mnemonic phrase")
         
-        seed = self.mnemonic_generator.to_seed(mnemonic_phrase)
-        private_key = ed25519.Ed25519PrivateKey.from_private_bytes(seed[:32])
+        seed = _mnemonic_seed(mnemonic_phrase)
+        private_key_bytes = seed[:32]
+        private_key = ed25519.Ed25519PrivateKey.from_private_bytes(private_key_bytes)
         public_key = private_key.public_key()
         
-        address = f"hybrid1{hashlib.sha256(public_key.public_bytes_raw()).hexdigest()[:39]}"
+        public_key_bytes = public_key.public_bytes_raw()
+        address = wallet_address(public_key_bytes)
         
         if address in self.wallets:
             return self.wallets[address]
         
         wallet = AdvancedHybridWallet(
             address=address,
-            private_key=private_key.private_bytes_raw().hex(),
-            public_key=public_key.public_bytes_raw().hex(),
+            private_key=private_key_bytes.hex(),
+            public_key=public_key_bytes.hex(),
             mnemonic_phrase=mnemonic_phrase
         )
         
@@ -5,7 +5,7 @@ x/licence module - NFT license validation for node operations
 Core module for HYBRID blockchain NFT-gated participation
 """
 import json
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import requests
@@ -14,7 +14,7 @@ class LicenseType(Enum):
     VALIDATOR = "HNL-VAL"
     STORAGE = "HNL-STR"
 
-@dataclass
+@dataclass(slots=True)
 class NFTLicenseProof:
     """Proof of NFT license ownership for cross-chain validation"""
     license_id: str
@@ -27,7 +27,7 @@ class NFTLicenseProof:
     tx_hash: str
     signature: str
 
-@dataclass
+@dataclass(slots=True)
 class LicenseDelegation:
     """Delegation of license rights to node operator"""
     license_id: str
@@ -46,6 +46,14 @@ class LicenceModule:
         self.license_proofs: Dict[str, NFTLicenseProof] = {}
         self.delegations: Dict[str, LicenseDelegation] = {}
         self.blacklisted_licenses: set = set()
+        # Immutable copy read by verification; replaced whole on each blacklisting
+        # so readers never observe the set mid-update
+        self._blacklist_snapshot: frozenset = frozenset()
+        
+        # Lookup indexes kept in step with license_proofs and delegations
+        self._owned: Dict[Tuple[str, LicenseType], Set[str]] = {}
+        self._delegated: Dict[str, Set[str]] = {}
+        self._license_delegations: Dict[str, Dict[str, LicenseDelegation]] = {}
         
         # Contract addresses on different chains
         self.hnl_contracts = {
@@ -64,7 +72,13 @@ class LicenceModule:
         if proof.license_id in self.blacklisted_licenses:
             return False
         
+        # Re-registration replaces the previous proof and its ownership entry
+        previous = self.license_proofs.get(proof.license_id)
+        if previous is not None:
+            self._owned[(previous.owner_address, previous.license_type)].discard(proof.license_id)
+        
         self.license_proofs[proof.license_id] = proof
+        self._owned.setdefault((proof.owner_address, proof.license_type), set()).add(proof.license_id)
         return True
     
     def _validate_external_ownership(self, proof: NFTLicenseProof) -> bool:
@@ -81,23 +95,25 @@ class LicenceModule:
     def verify_license(self, operator_address: str, license_type: LicenseType) -> bool:
         """Verify if address can operate node of given type"""
         # Check direct ownership
-        for proof in self.license_proofs.values():
-            if (proof.owner_address == operator_address and 
-                proof.license_type == license_type and
-                proof.license_id not in self.blacklisted_licenses):
+        blacklisted = self._blacklist_snapshot
+        for license_id in self._owned.get((operator_address, license_type), ()):
+            if license_id not in blacklisted:
                 return True
         
-        # Check delegations
-        for delegation in self.delegations.values():
-            if (delegation.delegate == operator_address and
-                delegation.license_id in self.license_proofs):
-                proof = self.license_proofs[delegation.license_id]
-                if (proof.license_type == license_type and
-                    proof.license_id not in self.blacklisted_licenses):
-                    return True
+        # Check delegations against the license's current proof
+        for license_id in self._delegated.get(operator_address, ()):
+            proof = self.license_proofs.get(license_id)
+            if (proof is not None and
+                proof.license_type == license_type and
+                license_id not in blacklisted):
+                return True
         
         return False
     
+    def verify_licenses(self, queries: List[Tuple[str, LicenseType]]) -> List[bool]:
+        """Verify many (operator_address, license_type) pairs, e.g. at node startup"""
+        return [self.verify_license(operator_address, license_type) for operator_address, license_type in queries]
+    
     def delegate_license(self, license_id: str, owner: str, delegate: str, 
                         expires_at: Optional[str] = None) -> bool:
         """Delegate license operation rights"""
@@ -114,11 +130,14 @@ class LicenceModule:
         )
         
         self.delegations[f"{license_id}:{delegate}"] = delegation
+        self._delegated.setdefault(delegate, set()).add(license_id)
+        self._license_delegations.setdefault(license_id, {})[delegate] = delegation
         return True
     
     def blacklist_license(self, license_id: str, reason: str = "slashing"):
         """Blacklist license (e.g., due to double-signing)"""
         self.blacklisted_licenses.add(license_id)
+        self._blacklist_snapshot = frozenset(self.blacklisted_licenses)
         print(f"License {license_id} blacklisted: {reason}")
     
     def get_license_info(self, license_id: str) -> Optional[Dict]:
@@ -127,10 +146,7 @@ class LicenceModule:
         if not proof:
             return None
         
-        delegations = [
-            d for d in self.delegations.values() 
-            if d.license_id == license_id
-        ]
+        delegations = list(self._license_delegations.get(license_id, {}).values())
         
         return {
             "proof": proof,
@@ -0,0 +1,34 @@
+"""
+Spiral Voynich Interface render tests
+"""
+
+import asyncio
+
+import numpy as np
+
+from blockchain import spiral_voynich_interface as svi
+
+
+def test_render_keeps_colliding_glyphs(monkeypatch):
+    """Glyphs sharing an id share one table row but keep their own render columns"""
+    hash_intents = svi._hash_intents
+
+    def colliding_hash_intents(intents):
+        # Give every odd glyph the id bytes of the glyph before it
+        digests = hash_intents(intents).copy()
+        digests[1::2, :4] = digests[0::2, :4]
+        return digests
+
+    monkeypatch.setattr(svi, "_hash_intents", colliding_hash_intents)
+    interface = svi.SpiralVoynichInterface()
+    result = asyncio.run(interface.render_32k_holograms(intent_theme="Collision"))
+
+    assert result['glyph_ids'][0::2] == result['glyph_ids'][1::2]
+    assert len(interface.glyph_table) == 16000
+
+    frequencies = np.linspace(702.5, 1099.7, 32000, endpoint=False)
+    truth_tokens = (len("Collision Fragment 00000") * frequencies / 10).astype(np.int64)
+    np.testing.assert_array_equal(result['type_codes'], np.arange(32000) % svi._N_GLYPH_TYPES)
+    np.testing.assert_array_equal(result['frequencies'], frequencies)
+    np.testing.assert_array_equal(result['truth_tokens'], truth_tokens)
+    assert result['total_truth_tokens'] == int(truth_tokens.sum())